@@ -257,9 +257,9 @@ class UserDocument:
         )
 
 
-@dataclass
+@dataclass(frozen=True)
 class SystemSettings:
-    """System settings model"""
+    """System settings model (immutable; use dataclasses.replace to derive changed settings)"""
     id: str = "system_settings"
     
     # Model Configuration
@@ -69,6 +69,12 @@ class Settings(BaseSettings):
     
     # Performance Configuration
     batch_size: int = Field(default=50, env="BATCH_SIZE")
+    embedding_batch_size: int = Field(default=256, env="EMBEDDING_BATCH_SIZE")
+    embedding_max_concurrency: int = Field(default=4, env="EMBEDDING_MAX_CONCURRENCY")
+    qdrant_upload_parallelism: int = Field(default=2, env="QDRANT_UPLOAD_PARALLELISM")
+    bulk_ingest_threshold: int = Field(default=10000, env="BULK_INGEST_THRESHOLD")
+    qdrant_indexing_threshold: int = Field(default=20000, env="QDRANT_INDEXING_THRESHOLD")
+    embedding_cache_size: int = Field(default=4096, env="EMBEDDING_CACHE_SIZE")
     max_concurrent_requests: int = Field(default=10, env="MAX_CONCURRENT_REQUESTS")
     memory_limit_gb: int = Field(default=8, env="MEMORY_LIMIT_GB")
     
@@ -88,6 +94,10 @@ class Settings(BaseSettings):
     minio_secure: bool = Field(default=False, env="MINIO_SECURE")
     minio_region: str = Field(default="us-east-1", env="MINIO_REGION")
     
+    # Chat History Configuration (optional - Redis-backed history shared across workers)
+    redis_url: Optional[str] = Field(default=None, env="REDIS_URL")
+    chat_history_ttl_seconds: int = Field(default=3600, env="CHAT_HISTORY_TTL_SECONDS")
+    
     # Batch Processing Configuration (optional)
     processing_timeout_minutes: int = Field(default=30, env="PROCESSING_TIMEOUT_MINUTES")
     max_concurrent_downloads: int = Field(default=5, env="MAX_CONCURRENT_DOWNLOADS")
@@ -3,27 +3,106 @@ Enhanced Chat Engine for Zenith - Supports multiple AI providers and user contex
 """
 
 from typing import List, Dict, Any, Optional, Union
-from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
 from datetime import datetime
+from functools import lru_cache
+import json
+import re
+import threading
 import time
-from src.core.langfuse_integration import trace_rag_flow_if_enabled, flush_langfuse
 
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
-from langchain_core.documents import Document
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import redis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+from src.core.langfuse_integration import trace_rag_flow_if_enabled, flush_langfuse_async
 
 from .config import config
 from .enhanced_vector_store import UserVectorStore
-from .ollama_integration import get_ollama_manager, OllamaChatEngine
 from .provider_manager import get_provider_manager
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Provider error classification, connection problems take precedence over API/key problems
+_CONNECTION_ERROR_RE = re.compile(r"connection|timeout", re.IGNORECASE)
+_API_ERROR_RE = re.compile(r"api|key", re.IGNORECASE)
+
+# Greetings/acknowledgements that never benefit from document retrieval
+_NON_INFORMATIONAL_WORDS = frozenset((
+    "hi", "hello", "hey", "hiya", "yo", "good", "morning", "afternoon", "evening",
+    "thanks", "thank", "you", "thx", "ty", "cheers", "ok", "okay", "k", "cool",
+    "great", "nice", "awesome", "perfect", "yes", "yeah", "yep", "no", "nope",
+    "sure", "bye", "goodbye", "please", "got", "it", "understood", "alright",
+))
+_WORD_RE = re.compile(r"[a-z0-9']+")
+
+# Seconds to wait before retrying an unreachable Redis server
+REDIS_RETRY_SECONDS = 30.0
+
+
+@lru_cache(maxsize=None)
+def _load_langchain():
+    """
+    Import LangChain chat classes on first use.
+    
+    Kept out of module scope so Ollama-only deployments never pay the
+    langchain_openai import cost.
+    """
+    from langchain_openai import ChatOpenAI
+    from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
+    return ChatOpenAI, HumanMessage, AIMessage, SystemMessage
+
+
+@lru_cache(maxsize=16)
+def _get_chat_openai(model_name: str, api_key: str, temperature: float):
+    """Get a shared ChatOpenAI client (and its HTTP connection pool) per model/key/temperature"""
+    ChatOpenAI = _load_langchain()[0]
+    return ChatOpenAI(
+        openai_api_key=api_key,
+        model=model_name,
+        temperature=temperature
+    )
+
+
+@lru_cache(maxsize=8)
+def _get_openai_client(api_key: str):
+    """Get a shared OpenAI SDK client (and its HTTP connection pool) per API key"""
+    from openai import OpenAI
+    return OpenAI(api_key=api_key)
+
 
-@dataclass
+@lru_cache(maxsize=16)
+def _get_ollama_chat_engine(model_name: str, base_url: str):
+    """
+    Get a shared Ollama chat engine per model/server, avoiding the model lookup on every provider
+    
+    Keyed by base URL so a changed Ollama endpoint gets a fresh engine. Only the
+    stateless chat_with_messages path may be used on a shared engine.
+    """
+    from .ollama_integration import OllamaChatEngine
+    return OllamaChatEngine(model_name, base_url)
+
+
+@lru_cache(maxsize=None)
+def _langchain_role_map() -> Dict[str, Any]:
+    """Map ChatMessage roles to LangChain message classes"""
+    _, HumanMessage, AIMessage, SystemMessage = _load_langchain()
+    return {"user": HumanMessage, "assistant": AIMessage, "system": SystemMessage}
+
+
+@dataclass(slots=True, frozen=True)
 class ChatMessage:
-    """Chat message with metadata"""
+    """Chat message with metadata (immutable once created)"""
     role: str  # user, assistant, system
     content: str
     timestamp: datetime
@@ -31,6 +110,125 @@ class ChatMessage:
     sources: Optional[List[Dict[str, Any]]] = None
 
 
+def _encode_chat_message(message: ChatMessage) -> Union[bytes, str]:
+    """Serialize a chat message for Redis storage"""
+    data = asdict(message)
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    data["timestamp"] = message.timestamp.isoformat()
+    return json.dumps(data)
+
+
+def _decode_chat_message(raw: Union[bytes, str]) -> ChatMessage:
+    """Deserialize a chat message stored by _encode_chat_message"""
+    data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+    return ChatMessage(**data)
+
+
+_redis_client = None
+_redis_retry_at = 0.0
+_redis_lock = threading.Lock()
+
+
+def _get_redis_client():
+    """
+    Get a shared Redis client for chat history, or None when not configured/reachable
+    
+    Only a connected client is cached; an unreachable server is retried at most
+    every REDIS_RETRY_SECONDS so history moves back to Redis once it recovers.
+    """
+    global _redis_client, _redis_retry_at
+    
+    if _redis_client is not None:
+        return _redis_client
+    if not REDIS_AVAILABLE or not config.redis_url:
+        return None
+    
+    with _redis_lock:
+        if _redis_client is not None or time.monotonic() < _redis_retry_at:
+            return _redis_client
+        
+        try:
+            client = redis.Redis.from_url(config.redis_url)
+            client.ping()
+            _redis_client = client
+            logger.info("Redis chat history store connected")
+        except Exception as e:
+            _redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+            logger.warning(f"Redis unavailable, using in-memory chat history: {e}")
+        return _redis_client
+
+
+class ConversationHistory:
+    """
+    Bounded conversation history for one user.
+    
+    Stored in a Redis list (``chat:<user_id>``) with a TTL when Redis is
+    configured, so history is shared across workers and survives restarts.
+    Falls back to an in-memory deque otherwise.
+    """
+    
+    MAX_MESSAGES = 50
+    
+    def __init__(self, user_id: Optional[str] = None, ttl_seconds: Optional[int] = None):
+        self._key = f"chat:{user_id}" if user_id else None
+        self._redis = _get_redis_client() if self._key else None
+        self._ttl_seconds = ttl_seconds or config.chat_history_ttl_seconds
+        self._local: deque = deque(maxlen=self.MAX_MESSAGES)
+    
+    def _fallback(self, error: Exception):
+        """Switch to in-memory storage after a Redis failure"""
+        logger.warning(f"Redis chat history failed for {self._key}, using in-memory history: {error}")
+        self._redis = None
+    
+    def extend(self, *messages: ChatMessage):
+        """Append messages, trimming to MAX_MESSAGES"""
+        if self._redis is not None:
+            try:
+                pipe = self._redis.pipeline()
+                pipe.rpush(self._key, *(_encode_chat_message(m) for m in messages))
+                pipe.ltrim(self._key, -self.MAX_MESSAGES, -1)
+                pipe.expire(self._key, self._ttl_seconds)
+                pipe.execute()
+                return
+            except Exception as e:
+                self._fallback(e)
+        self._local.extend(messages)
+    
+    def recent(self, count: int) -> List[ChatMessage]:
+        """Get the last ``count`` messages, oldest first"""
+        if count <= 0:
+            return []
+        if self._redis is not None:
+            try:
+                return [_decode_chat_message(raw) for raw in self._redis.lrange(self._key, -count, -1)]
+            except Exception as e:
+                self._fallback(e)
+        return list(self._local)[-count:]
+    
+    def all(self) -> List[ChatMessage]:
+        """Get every stored message, oldest first"""
+        return self.recent(self.MAX_MESSAGES)
+    
+    def clear(self):
+        """Remove all messages"""
+        if self._redis is not None:
+            try:
+                self._redis.delete(self._key)
+            except Exception as e:
+                self._fallback(e)
+        self._local.clear()
+    
+    def __len__(self) -> int:
+        if self._redis is not None:
+            try:
+                return self._redis.llen(self._key)
+            except Exception as e:
+                self._fallback(e)
+        return len(self._local)
+
+
 class ChatProvider:
     """Abstract base for chat providers"""
     
@@ -46,6 +244,9 @@ class ChatProvider:
 class OpenAIChatProvider(ChatProvider):
     """OpenAI chat provider"""
     
+    # Seconds a health check result is reused
+    HEALTH_CACHE_SECONDS = 30
+    
     def __init__(self, model_name: Optional[str] = None, api_key: Optional[str] = None):
         self.model_name = model_name or config.openai_model
         self.api_key = api_key or config.openai_api_key
@@ -53,30 +254,21 @@ class OpenAIChatProvider(ChatProvider):
         if not self.api_key:
             raise ValueError("OpenAI API key is required")
         
-        self.llm = ChatOpenAI(
-            openai_api_key=self.api_key,
-            model=self.model_name,
-            temperature=0.3
-        )
+        self._role_map = _langchain_role_map()
+        self.llm = _get_chat_openai(self.model_name, self.api_key, 0.3)
+        self._health_cache: Optional[tuple] = None  # (healthy, expires_at)
     
     def chat(self, messages: List[ChatMessage], system_prompt: Optional[str] = None) -> str:
         """Generate chat response using OpenAI"""
         try:
-            # Convert to LangChain messages
-            langchain_messages = []
-            
-            # Add system message if provided
-            if system_prompt:
-                langchain_messages.append(SystemMessage(content=system_prompt))
+            role_map = self._role_map
             
-            # Add conversation messages
-            for msg in messages:
-                if msg.role == "user":
-                    langchain_messages.append(HumanMessage(content=msg.content))
-                elif msg.role == "assistant":
-                    langchain_messages.append(AIMessage(content=msg.content))
-                elif msg.role == "system":
-                    langchain_messages.append(SystemMessage(content=msg.content))
+            # Convert to LangChain messages, system message first if provided
+            langchain_messages = [role_map["system"](content=system_prompt)] if system_prompt else []
+            langchain_messages.extend(
+                role_map[msg.role](content=msg.content)
+                for msg in messages if msg.role in role_map
+            )
             
             # Generate response
             response = self.llm.invoke(langchain_messages)
@@ -87,25 +279,31 @@ class OpenAIChatProvider(ChatProvider):
             raise RuntimeError(f"Chat generation failed: {e}")
     
     def health_check(self) -> bool:
-        """Check if OpenAI is accessible"""
+        """Check if OpenAI is accessible (model lookup, no tokens billed)"""
+        cached = self._health_cache
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+        
         try:
-            # Simple test with minimal message
-            test_message = [ChatMessage(
-                role="user",
-                content="Hello",
-                timestamp=datetime.now()
-            )]
-            response = self.chat(test_message)
-            return bool(response)
+            _get_openai_client(self.api_key).models.retrieve(self.model_name)
+            healthy = True
         except Exception as e:
             logger.error(f"OpenAI health check failed: {e}")
-            return False
+            healthy = False
+        
+        self._health_cache = (healthy, time.monotonic() + self.HEALTH_CACHE_SECONDS)
+        return healthy
 
 
 class OllamaChatProvider(ChatProvider):
     """Ollama chat provider"""
     
+    # Roles forwarded to the Ollama chat API
+    _HISTORY_ROLES = frozenset(("user", "assistant"))
+    
     def __init__(self, model_name: Optional[str] = None):
+        from .ollama_integration import get_ollama_manager
+        
         self.model_name = model_name or config.ollama_chat_model
         
         # Check if Ollama is available
@@ -113,30 +311,24 @@ class OllamaChatProvider(ChatProvider):
         if not ollama_manager.is_available():
             raise ValueError("Ollama is not available")
         
-        self.chat_engine = OllamaChatEngine(self.model_name)
+        self.chat_engine = _get_ollama_chat_engine(self.model_name, config.ollama_base_url)
     
     def chat(self, messages: List[ChatMessage], system_prompt: Optional[str] = None) -> str:
         """Generate chat response using Ollama"""
         try:
-            # Clear previous conversation for fresh context
-            self.chat_engine.clear_history()
-            
-            # Add non-user/assistant messages to history
-            for msg in messages[:-1]:  # All except the last message
-                if msg.role in ["user", "assistant"]:
-                    self.chat_engine.conversation_history.append({
-                        "role": msg.role,
-                        "content": msg.content
-                    })
-            
-            # Get the last user message
-            last_message = messages[-1]
-            if last_message.role != "user":
+            # Last message must come from the user
+            if messages[-1].role != "user":
                 raise ValueError("Last message must be from user")
             
+            # Pass the full user/assistant exchange; the engine's own history is not used
+            history_roles = self._HISTORY_ROLES
+            ollama_messages = [
+                {"role": msg.role, "content": msg.content}
+                for msg in messages if msg.role in history_roles
+            ]
+            
             # Generate response
-            response = self.chat_engine.chat(last_message.content, system_prompt)
-            return response
+            return self.chat_engine.chat_with_messages(ollama_messages, system_prompt)
             
         except Exception as e:
             logger.error(f"Ollama chat generation failed: {e}")
@@ -170,6 +362,9 @@ class EnhancedChatEngine:
     Enhanced chat engine with user context, multiple providers, and RAG capabilities
     """
     
+    # Seconds to wait for each health probe (matches the Ollama client's health timeout)
+    HEALTH_CHECK_TIMEOUT = 10
+    
     def __init__(self, 
                  user_id: Optional[str] = None,
                  vector_store: Optional[UserVectorStore] = None,
@@ -185,6 +380,9 @@ class EnhancedChatEngine:
         self.user_id = user_id
         self.vector_store = vector_store
         
+        # Without a user there is no conversation to keep, so chat() skips history entirely
+        self._stateless = user_id is None
+        
         # Initialize chat provider with better error handling
         try:
             self.chat_provider = get_chat_provider(chat_provider)
@@ -211,11 +409,14 @@ class EnhancedChatEngine:
                 logger.error(f"Fallback provider initialization failed: {fallback_error}")
                 raise RuntimeError(f"Cannot initialize any chat provider: {e}, fallback: {fallback_error}")
         
+        self._refresh_provider_meta()
+        
         # Conversation history
-        self.conversation_history: List[ChatMessage] = []
+        self.conversation_history = ConversationHistory(user_id)
         
         # System prompt
         self.system_prompt = self._get_default_system_prompt()
+        self._build_rag_prompt_parts()
         
         # Register with provider manager for dynamic updates
         try:
@@ -226,6 +427,11 @@ class EnhancedChatEngine:
         
         logger.info(f"Enhanced chat engine initialized for user: {user_id}")
     
+    def _refresh_provider_meta(self):
+        """Cache provider name and model used for tracing; call after every provider change"""
+        self._provider_name = type(self.chat_provider).__name__
+        self._provider_model = getattr(self.chat_provider, 'model_name', 'unknown')
+    
     def _get_default_system_prompt(self) -> str:
         """Get default system prompt"""
         return """You are Zenith, an AI assistant specialized in analyzing and discussing PDF documents. 
@@ -245,9 +451,28 @@ Guidelines:
 
 When no documents are available, you can still assist with general questions using your knowledge."""
     
+    def _build_rag_prompt_parts(self):
+        """Precompute the constant parts of the RAG prompt around the document context"""
+        self._rag_prompt_head_user = f"{self.system_prompt}\n\nCONTEXT FROM USER'S DOCUMENTS:\n"
+        self._rag_prompt_head_system = f"{self.system_prompt}\n\nCONTEXT FROM SYSTEM DOCUMENTS (ALL USERS):\n"
+        self._rag_prompt_tail = (
+            "\n\nPlease answer the user's question based on the provided context. "
+            "If the context doesn't contain relevant information, mention that and "
+            "provide what help you can with your general knowledge."
+        )
+    
+    def _should_retrieve(self, message: str) -> bool:
+        """Whether a message could benefit from RAG (False for greetings, thanks, yes/no, etc.)"""
+        words = _WORD_RE.findall(message.lower())
+        if not words or all(word in _NON_INFORMATIONAL_WORDS for word in words):
+            logger.debug(f"Skipping retrieval for non-informational message: {message[:50]!r}")
+            return False
+        return True
+    
     def set_system_prompt(self, prompt: str):
         """Set custom system prompt"""
         self.system_prompt = prompt
+        self._build_rag_prompt_parts()
     
     def chat(self, 
              message: str, 
@@ -279,9 +504,10 @@ When no documents are available, you can still assist with general questions usi
             
             # Get relevant documents if using RAG
             source_documents = []
+            search_results_for_trace = []
             enhanced_prompt = self.system_prompt
             
-            if use_rag and self.vector_store:
+            if use_rag and self.vector_store and self._should_retrieve(message):
                 # Search for relevant documents with user filter preference
                 relevant_docs = self.vector_store.similarity_search(
                     query=message,
@@ -292,101 +518,109 @@ When no documents are available, you can still assist with general questions usi
                 if relevant_docs:
                     # Prepare context from documents
                     context_chunks = []
+                    seen_chunks = set()
+                    seen_content = set()
                     for doc in relevant_docs:
+                        page_content = doc.page_content
+                        metadata = doc.metadata
+                        
+                        # Skip repeated chunks and near-identical content from other documents
+                        document_id = metadata.get("document_id")
+                        if document_id is not None:
+                            chunk_key = (document_id, metadata.get("chunk_index"))
+                            if chunk_key in seen_chunks:
+                                continue
+                            seen_chunks.add(chunk_key)
+                        content_hash = hash(page_content[:256])
+                        if content_hash in seen_content:
+                            continue
+                        seen_content.add(content_hash)
+                        
+                        filename = metadata.get("filename", "Unknown")
+                        page = metadata.get("page", "Unknown")
+                        
                         # Extract metadata for sources
                         source_info = {
-                            "content": doc.page_content[:200] + "...",
-                            "filename": doc.metadata.get("filename", "Unknown"),
-                            "page": doc.metadata.get("page", "Unknown"),
-                            "document_id": doc.metadata.get("document_id"),
-                            "chunk_index": doc.metadata.get("chunk_index", 0)
+                            "content": page_content[:200] + "...",
+                            "filename": filename,
+                            "page": page,
+                            "document_id": document_id,
+                            "chunk_index": metadata.get("chunk_index", 0)
                         }
                         source_documents.append(source_info)
-                        context_chunks.append(doc.page_content)
-                    
-                    # Enhance system prompt with context
-                    context_text = "\n\n".join(context_chunks)
-                    
-                    # Customize prompt based on search scope
-                    if user_filter:
-                        context_source = "USER'S DOCUMENTS"
-                    else:
-                        context_source = "SYSTEM DOCUMENTS (ALL USERS)"
+                        context_chunks.append(page_content)
+                        
+                        # Keep the first 3 results for tracing
+                        if len(search_results_for_trace) < 3:
+                            search_results_for_trace.append({
+                                "content": page_content[:200] + "..." if len(page_content) > 200 else page_content,
+                                "filename": filename,
+                                "page": page
+                            })
                     
-                    enhanced_prompt = f"""{self.system_prompt}
-
-CONTEXT FROM {context_source}:
-{context_text}
-
-Please answer the user's question based on the provided context. If the context doesn't contain relevant information, mention that and provide what help you can with your general knowledge."""
+                    # Enhance system prompt with context, header depends on search scope
+                    prompt_head = self._rag_prompt_head_user if user_filter else self._rag_prompt_head_system
+                    enhanced_prompt = prompt_head + "\n\n".join(context_chunks) + self._rag_prompt_tail
             
             # Prepare conversation context
-            context_messages = self.conversation_history[-max_context_messages:] if self.conversation_history else []
-            context_messages.append(user_message)
+            if self._stateless:
+                context_messages = [user_message]
+            else:
+                context_messages = self.conversation_history.recent(max_context_messages)
+                context_messages.append(user_message)
             
             # Generate response
             try:
                 response_content = self.chat_provider.chat(context_messages, enhanced_prompt)
             except Exception as provider_error:
-                logger.error(f"Chat provider error: {provider_error}")
+                error_text = str(provider_error)
+                logger.error(f"Chat provider error: {error_text}")
                 # Try to provide a helpful error message
-                if "connection" in str(provider_error).lower() or "timeout" in str(provider_error).lower():
+                if _CONNECTION_ERROR_RE.search(error_text):
                     return {
                         "answer": "I'm sorry, but I'm having trouble connecting to the AI service. Please check if the AI provider is running and try again.",
                         "source_documents": source_documents,
-                        "error": f"Connection error: {str(provider_error)}"
+                        "error": f"Connection error: {error_text}"
                     }
-                elif "api" in str(provider_error).lower() or "key" in str(provider_error).lower():
+                elif _API_ERROR_RE.search(error_text):
                     return {
                         "answer": "I'm sorry, but there's an issue with the AI service configuration. Please check the API key settings.",
                         "source_documents": source_documents,
-                        "error": f"API error: {str(provider_error)}"
+                        "error": f"API error: {error_text}"
                     }
                 else:
                     return {
                         "answer": "I'm sorry, but I encountered an error while generating a response. Please try again or contact support.",
                         "source_documents": source_documents,
-                        "error": f"Provider error: {str(provider_error)}"
+                        "error": f"Provider error: {error_text}"
                     }
             
-            # Create assistant message
-            assistant_message = ChatMessage(
-                role="assistant",
-                content=response_content,
-                timestamp=datetime.now(),
-                user_id=self.user_id,
-                sources=source_documents
-            )
-            
-            # Update conversation history
-            self.conversation_history.append(user_message)
-            self.conversation_history.append(assistant_message)
+            response_timestamp = datetime.now()
             
-            # Keep conversation history manageable
-            if len(self.conversation_history) > 50:
-                self.conversation_history = self.conversation_history[-40:]
+            if not self._stateless:
+                # Create assistant message
+                assistant_message = ChatMessage(
+                    role="assistant",
+                    content=response_content,
+                    timestamp=response_timestamp,
+                    user_id=self.user_id,
+                    sources=source_documents
+                )
+                
+                # Update conversation history (bounded by ConversationHistory.MAX_MESSAGES)
+                self.conversation_history.extend(user_message, assistant_message)
             
             # Calculate total time and trace the complete RAG flow
             total_time = time.time() - start_time
             
-            # Prepare search results for tracing
-            search_results_for_trace = []
-            if use_rag and 'relevant_docs' in locals() and relevant_docs:
-                for doc in relevant_docs[:3]:  # First 3 for brevity
-                    search_results_for_trace.append({
-                        "content": doc.page_content[:200] + "..." if len(doc.page_content) > 200 else doc.page_content,
-                        "filename": doc.metadata.get("filename", "Unknown"),
-                        "page": doc.metadata.get("page", "Unknown")
-                    })
-            
             # Trace the complete RAG flow
             trace_rag_flow_if_enabled(
                 user_input=message,
                 search_query=message,
                 search_results=search_results_for_trace,
                 llm_response=response_content,
-                provider=type(self.chat_provider).__name__,
-                model=getattr(self.chat_provider, 'model', 'unknown'),
+                provider=self._provider_name,
+                model=self._provider_model,
                 total_time=total_time,
                 metadata={
                     "use_rag": use_rag,
@@ -397,13 +631,13 @@ Please answer the user's question based on the provided context. If the context
                 }
             )
             
-            # Flush traces to ensure they're sent
-            flush_langfuse()
+            # Flush traces in the background so the response isn't held up
+            flush_langfuse_async()
             
             return {
                 "answer": response_content,
                 "source_documents": source_documents,
-                "timestamp": assistant_message.timestamp.isoformat(),
+                "timestamp": response_timestamp.isoformat(),
                 "metadata": {
                     "total_time": total_time,
                     "search_results": len(search_results_for_trace),
@@ -434,7 +668,7 @@ Please answer the user's question based on the provided context. If the context
     def get_conversation_history(self) -> List[Dict[str, Any]]:
         """Get conversation history in JSON format"""
         history = []
-        for msg in self.conversation_history:
+        for msg in self.conversation_history.all():
             history.append({
                 "role": msg.role,
                 "content": msg.content,
@@ -443,9 +677,24 @@ Please answer the user's question based on the provided context. If the context
             })
         return history
     
+    def get_conversation_history_json(self) -> bytes:
+        """Get conversation history as JSON bytes, ready to return from a web handler"""
+        history = [
+            {
+                "role": msg.role,
+                "content": msg.content,
+                "timestamp": msg.timestamp,
+                "sources": msg.sources or []
+            }
+            for msg in self.conversation_history.all()
+        ]
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(history)
+        return json.dumps(history, default=datetime.isoformat).encode("utf-8")
+    
     def clear_conversation_history(self):
         """Clear conversation history"""
-        self.conversation_history = []
+        self.conversation_history.clear()
         logger.info(f"Cleared conversation history for user: {self.user_id}")
     
     def get_user_document_stats(self) -> Dict[str, Any]:
@@ -469,20 +718,30 @@ Please answer the user's question based on the provided context. If the context
             "user_documents": 0
         }
         
-        # Check chat provider
+        # Run the probes concurrently; don't wait on stragglers past the timeout
+        executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="chat-health")
         try:
-            status["chat_provider"]["healthy"] = self.chat_provider.health_check()
-        except Exception as e:
-            logger.error(f"Chat provider health check failed: {e}")
-        
-        # Check vector store
-        if self.vector_store:
+            provider_future = executor.submit(self.chat_provider.health_check)
+            if self.vector_store:
+                store_future = executor.submit(self.vector_store.health_check)
+                stats_future = executor.submit(self.vector_store.get_user_stats)
+            
+            # Check chat provider
             try:
-                status["vector_store"]["healthy"] = self.vector_store.health_check()
-                user_stats = self.vector_store.get_user_stats()
-                status["user_documents"] = user_stats.get("total_documents", 0)
+                status["chat_provider"]["healthy"] = provider_future.result(timeout=self.HEALTH_CHECK_TIMEOUT)
             except Exception as e:
-                logger.error(f"Vector store health check failed: {e}")
+                logger.error(f"Chat provider health check failed: {e}")
+            
+            # Check vector store
+            if self.vector_store:
+                try:
+                    status["vector_store"]["healthy"] = store_future.result(timeout=self.HEALTH_CHECK_TIMEOUT)
+                    user_stats = stats_future.result(timeout=self.HEALTH_CHECK_TIMEOUT)
+                    status["user_documents"] = user_stats.get("total_documents", 0)
+                except Exception as e:
+                    logger.error(f"Vector store health check failed: {e}")
+        finally:
+            executor.shutdown(wait=False)
         
         return status
     
@@ -497,13 +756,14 @@ Please answer the user's question based on the provided context. If the context
                 
                 # Get new provider
                 self.chat_provider = get_chat_provider()
+                self._refresh_provider_meta()
                 
-                logger.info(f"Chat engine provider updated from {type(old_provider).__name__} to {type(self.chat_provider).__name__}")
+                logger.info(f"Chat engine provider updated from {type(old_provider).__name__} to {self._provider_name}")
                 
                 # Optionally clear conversation history to avoid confusion
                 if change_type == 'chat_provider':
                     logger.info("Clearing conversation history due to provider switch")
-                    self.conversation_history = []
+                    self.conversation_history.clear()
             
         except Exception as e:
             logger.error(f"Error handling provider change in chat engine: {e}")
@@ -512,6 +772,7 @@ Please answer the user's question based on the provided context. If the context
         """Reinitialize providers (called by provider manager)"""
         try:
             self.chat_provider = get_chat_provider()
+            self._refresh_provider_meta()
             logger.info("Chat engine providers reinitialized")
         except Exception as e:
             logger.error(f"Error reinitializing chat engine providers: {e}")
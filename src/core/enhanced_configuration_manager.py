@@ -5,28 +5,75 @@ settings, and real-time updates with rollback capabilities.
 """
 
 import os
+import re
 import json
 import yaml
-from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List, Tuple, Union, Callable
+from collections import OrderedDict
 from enum import Enum
 from pathlib import Path
 import sqlite3
-from dataclasses import dataclass, asdict
+import queue
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, field, fields
 import threading
 import time
+import random
+import weakref
+import inspect
 from abc import ABC, abstractmethod
 
-# Pydantic for validation
-from pydantic import BaseModel, Field, ValidationError, validator
-from pydantic.types import StrictStr, StrictInt, StrictBool, StrictFloat
-
 from .secrets_manager import get_secrets_manager, SecretType
-from src.utils.database_security import secure_sqlite_connection
+from src.utils.database_security import open_secure_sqlite_connection, DEFAULT_SQLITE_TIMEOUT
 from src.utils.logger import get_logger
 
+# Prefer the libyaml C bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = get_logger(__name__)
 
+# Value format patterns used by ConfigSchema
+_URL_RE = re.compile(
+    r'^https?://'  # http:// or https://
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
+    r'localhost|'  # localhost...
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
+    r'(?::\d+)?'  # optional port
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# Configuration keys: alphanumerics, underscores and dots
+_KEY_RE = re.compile(r'\A[A-Za-z0-9_.]+\Z')
+
+# Secret references look like ${secret:key}
+_SECRET_PREFIX = "${secret:"
+_SECRET_RE = re.compile(r'\$\{secret:(.*)\}', re.DOTALL)
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize to JSON, using orjson when it can represent the value"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value).decode()
+        except TypeError:
+            # e.g. non-string dict keys or out-of-range ints; let json decide
+            pass
+    return json.dumps(value)
+
+
+def _json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON, using orjson when available"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
 
 class ConfigJSONEncoder(json.JSONEncoder):
     """Custom JSON encoder for configuration schemas"""
@@ -74,39 +121,131 @@ class ConfigValidationRule:
     
     def validate(self, value: Any) -> Tuple[bool, Optional[str]]:
         """Validate value against rule"""
+        return self.compile()(value)
+    
+    def compile(self) -> Callable[[Any], Tuple[bool, Optional[str]]]:
+        """Build a checker specialized for this rule, resolving parameters once"""
+        def passes(value: Any) -> Tuple[bool, Optional[str]]:
+            return True, None
+        
         try:
             if self.rule_type == 'range':
                 min_val = self.parameters.get('min')
                 max_val = self.parameters.get('max')
                 
-                if min_val is not None and value < min_val:
-                    return False, f"Value must be >= {min_val}"
-                if max_val is not None and value > max_val:
-                    return False, f"Value must be <= {max_val}"
+                def check(value: Any) -> Tuple[bool, Optional[str]]:
+                    if min_val is not None and value < min_val:
+                        return False, f"Value must be >= {min_val}"
+                    if max_val is not None and value > max_val:
+                        return False, f"Value must be <= {max_val}"
+                    return True, None
                     
             elif self.rule_type == 'regex':
-                import re
                 pattern = self.parameters.get('pattern')
-                if pattern and not re.match(pattern, str(value)):
-                    return False, self.error_message or f"Value must match pattern: {pattern}"
+                if not pattern:
+                    return passes
+                compiled_pattern = re.compile(pattern)
+                message = self.error_message or f"Value must match pattern: {pattern}"
+                
+                def check(value: Any) -> Tuple[bool, Optional[str]]:
+                    if not compiled_pattern.match(str(value)):
+                        return False, message
+                    return True, None
                     
             elif self.rule_type == 'choices':
                 choices = self.parameters.get('choices', [])
-                if choices and value not in choices:
-                    return False, f"Value must be one of: {choices}"
+                if not choices:
+                    return passes
+                
+                def check(value: Any) -> Tuple[bool, Optional[str]]:
+                    if value not in choices:
+                        return False, f"Value must be one of: {choices}"
+                    return True, None
                     
             elif self.rule_type == 'custom':
                 validator_func = self.parameters.get('function')
-                if validator_func and callable(validator_func):
-                    return validator_func(value)
+                if not (validator_func and callable(validator_func)):
+                    return passes
+                check = validator_func
             
-            return True, None
+            else:
+                return passes
             
         except Exception as e:
-            return False, f"Validation error: {e}"
+            compile_error = e
+            
+            def check(value: Any) -> Tuple[bool, Optional[str]]:
+                return False, f"Validation error: {compile_error}"
+            return check
+        
+        def safe_check(value: Any) -> Tuple[bool, Optional[str]]:
+            try:
+                return check(value)
+            except Exception as e:
+                return False, f"Validation error: {e}"
+        
+        return safe_check
+
+
+def _check_string(value: Any) -> Optional[str]:
+    if not isinstance(value, (str, type(None))):
+        return "Value must be a string"
+    return None
+
+
+def _check_integer(value: Any) -> Optional[str]:
+    if not isinstance(value, (int, type(None))) or isinstance(value, bool):
+        return "Value must be an integer"
+    return None
+
+
+def _check_float(value: Any) -> Optional[str]:
+    if not isinstance(value, (float, int, type(None))) or isinstance(value, bool):
+        return "Value must be a number"
+    return None
+
+
+def _check_boolean(value: Any) -> Optional[str]:
+    if not isinstance(value, (bool, type(None))):
+        return "Value must be a boolean"
+    return None
+
+
+def _check_json(value: Any) -> Optional[str]:
+    if value is not None:
+        try:
+            _json_dumps(value)
+        except (TypeError, ValueError):
+            return "Value must be JSON serializable"
+    return None
+
+
+def _check_url(value: Any) -> Optional[str]:
+    if value and _URL_RE.match(value) is None:
+        return "Value must be a valid URL"
+    return None
+
 
+def _check_email(value: Any) -> Optional[str]:
+    if value and _EMAIL_RE.match(value) is None:
+        return "Value must be a valid email address"
+    return None
 
-class ConfigSchema(BaseModel):
+
+# Type checks per value type; returns an error message or None (types not listed are unchecked)
+_TYPE_CHECKS: Dict[ConfigValueType, Callable[[Any], Optional[str]]] = {
+    ConfigValueType.STRING: _check_string,
+    ConfigValueType.INTEGER: _check_integer,
+    ConfigValueType.FLOAT: _check_float,
+    ConfigValueType.BOOLEAN: _check_boolean,
+    ConfigValueType.JSON: _check_json,
+    ConfigValueType.URL: _check_url,
+    ConfigValueType.EMAIL: _check_email,
+}
+
+
+@dataclass(slots=True, kw_only=True)
+class ConfigSchema:
     """Configuration schema definition"""
     key: str
     display_name: str
@@ -118,81 +257,213 @@ class ConfigSchema(BaseModel):
     is_readonly: bool = False
     scope: ConfigScope = ConfigScope.APPLICATION
     category: str = "general"
-    validation_rules: List[Dict[str, Any]] = Field(default_factory=list)
+    validation_rules: List[Dict[str, Any]] = field(default_factory=list)
     environment_specific: bool = False
     restart_required: bool = False
     deprecated: bool = False
     deprecation_message: str = ""
     
-    @validator('key')
-    def validate_key(cls, v):
+    _compiled_validator: Optional[Callable] = field(default=None, init=False, repr=False, compare=False)
+    _json_cache: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.validate_key(self.key)
+        # Schemas loaded from storage carry enum values as plain strings
+        if not isinstance(self.value_type, ConfigValueType):
+            self.value_type = ConfigValueType(self.value_type)
+        if not isinstance(self.scope, ConfigScope):
+            self.scope = ConfigScope(self.scope)
+    
+    @staticmethod
+    def validate_key(v):
         if not v or not isinstance(v, str):
             raise ValueError("Key must be a non-empty string")
-        if not v.replace('_', '').replace('.', '').isalnum():
+        if not _KEY_RE.fullmatch(v):
             raise ValueError("Key can only contain alphanumeric characters, underscores, and dots")
         return v
     
+    def model_dump(self) -> Dict[str, Any]:
+        """Public schema fields as a dict (enums left as members)"""
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+    
+    def dict(self) -> Dict[str, Any]:
+        """Alias of model_dump() kept for callers of the former pydantic model"""
+        return self.model_dump()
+    
+    def to_json(self) -> str:
+        """Serialize schema for storage (computed once; schemas aren't modified after registration)"""
+        if self._json_cache is None:
+            self._json_cache = json.dumps(self.dict(), cls=ConfigJSONEncoder)
+        return self._json_cache
+    
     def validate_value(self, value: Any) -> Tuple[bool, Optional[str]]:
         """Validate value against schema"""
-        # Type validation
-        try:
-            if self.value_type == ConfigValueType.STRING:
-                if not isinstance(value, (str, type(None))):
-                    return False, "Value must be a string"
-            elif self.value_type == ConfigValueType.INTEGER:
-                if not isinstance(value, (int, type(None))) or isinstance(value, bool):
-                    return False, "Value must be an integer"
-            elif self.value_type == ConfigValueType.FLOAT:
-                if not isinstance(value, (float, int, type(None))) or isinstance(value, bool):
-                    return False, "Value must be a number"
-            elif self.value_type == ConfigValueType.BOOLEAN:
-                if not isinstance(value, (bool, type(None))):
-                    return False, "Value must be a boolean"
-            elif self.value_type == ConfigValueType.JSON:
-                if value is not None:
-                    try:
-                        json.dumps(value)
-                    except (TypeError, ValueError):
-                        return False, "Value must be JSON serializable"
-            elif self.value_type == ConfigValueType.URL:
-                if value and not self._is_valid_url(value):
-                    return False, "Value must be a valid URL"
-            elif self.value_type == ConfigValueType.EMAIL:
-                if value and not self._is_valid_email(value):
-                    return False, "Value must be a valid email address"
-                    
-        except Exception as e:
-            return False, f"Type validation error: {e}"
+        validator = self._compiled_validator or self.compile_validator()
+        return validator(value)
+    
+    def compile_validator(self) -> Callable[[Any], Tuple[bool, Optional[str]]]:
+        """
+        Build and cache a validator specialized for this schema.
         
-        # Custom validation rules
+        The type check and each validation rule are resolved once here instead
+        of being dispatched on every validate_value call. Call again after
+        changing value_type or validation_rules.
+        """
+        type_check = _TYPE_CHECKS.get(self.value_type)
+        
+        rule_checks = []
         for rule_data in self.validation_rules:
             try:
-                rule = ConfigValidationRule(**rule_data)
-                is_valid, error = rule.validate(value)
-                if not is_valid:
-                    return False, error
+                rule_checks.append(ConfigValidationRule(**rule_data).compile())
             except Exception as e:
                 logger.warning(f"Validation rule error for {self.key}: {e}")
+        rule_checks = tuple(rule_checks)
+        
+        def validate(value: Any) -> Tuple[bool, Optional[str]]:
+            # Type validation
+            if type_check is not None:
+                try:
+                    error = type_check(value)
+                except Exception as e:
+                    return False, f"Type validation error: {e}"
+                if error:
+                    return False, error
+            
+            # Custom validation rules
+            for check in rule_checks:
+                is_valid, error = check(value)
+                if not is_valid:
+                    return False, error
+            
+            return True, None
         
-        return True, None
+        self._compiled_validator = validate
+        return validate
     
     def _is_valid_url(self, url: str) -> bool:
         """Validate URL format"""
-        import re
-        url_pattern = re.compile(
-            r'^https?://'  # http:// or https://
-            r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'  # domain...
-            r'localhost|'  # localhost...
-            r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'  # ...or ip
-            r'(?::\d+)?'  # optional port
-            r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-        return url_pattern.match(url) is not None
+        return _URL_RE.match(url) is not None
     
     def _is_valid_email(self, email: str) -> bool:
         """Validate email format"""
-        import re
-        email_pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
-        return email_pattern.match(email) is not None
+        return _EMAIL_RE.match(email) is not None
+
+
+# Record a set_value change; old value and change type come from the current row, if any
+_SQL_INSERT_HISTORY_FOR_SET = """
+    INSERT INTO configuration_history 
+    (key, old_value, new_value, value_type, environment, change_type, changed_by, reason)
+    VALUES (
+        ?,
+        (SELECT value FROM configuration_values WHERE key = ? AND environment = ?),
+        ?, ?, ?,
+        CASE WHEN EXISTS (SELECT 1 FROM configuration_values WHERE key = ? AND environment = ?)
+             THEN 'update' ELSE 'create' END,
+        ?, ?
+    )
+"""
+
+# Statements below are module constants so each pooled connection's
+# prepared statement cache (keyed by SQL text) keeps hitting them
+_SQL_GET_VALUE = """
+    SELECT value, value_type FROM configuration_values 
+    WHERE key = ? AND environment = ?
+"""
+
+_SQL_DELETE_VALUE = """
+    DELETE FROM configuration_values 
+    WHERE key = ? AND environment = ?
+"""
+
+_SQL_INSERT_HISTORY_FOR_DELETE = """
+    INSERT INTO configuration_history 
+    (key, old_value, new_value, value_type, environment, change_type, changed_by, reason)
+    VALUES (?, ?, NULL, ?, ?, 'delete', ?, ?)
+"""
+
+_SQL_LIST_KEYS = """
+    SELECT key FROM configuration_values 
+    WHERE environment = ? 
+    ORDER BY key
+"""
+
+_SQL_STORE_SCHEMA = """
+    INSERT OR REPLACE INTO configuration_schemas 
+    (key, schema_json, updated_at)
+    VALUES (?, ?, CURRENT_TIMESTAMP)
+"""
+
+_SQL_COUNT_KEYS = "SELECT COUNT(*) FROM configuration_values WHERE environment = ?"
+
+_SQL_GET_ALL_VALUES = """
+    SELECT key, value, value_type FROM configuration_values 
+    WHERE environment = ? 
+    ORDER BY key
+"""
+
+_SQL_GET_SCHEMA = "SELECT schema_json FROM configuration_schemas WHERE key = ?"
+
+# History rows for one key, newest first (ids increase with every write)
+_SQL_COUNT_HISTORY_UP_TO = """
+    SELECT COUNT(*) FROM (
+        SELECT 1 FROM configuration_history 
+        WHERE key = ? AND environment = ? 
+        LIMIT ?
+    )
+"""
+
+_SQL_HISTORY_AT_OFFSET = """
+    SELECT new_value, value_type, change_type FROM configuration_history 
+    WHERE key = ? AND environment = ? 
+    ORDER BY id DESC 
+    LIMIT 1 OFFSET ?
+"""
+
+# Every write (including deletes) appends a history row, so the newest history
+# id is a cheap change marker; MAX over the rowid is an O(1) b-tree lookup
+_SQL_LAST_CHANGE_ID = "SELECT MAX(id) FROM configuration_history"
+
+# Upsert keeps the row (and created_at) on update; INSERT OR REPLACE for SQLite < 3.24
+if sqlite3.sqlite_version_info >= (3, 24, 0):
+    _SQL_UPSERT_VALUE = """
+        INSERT INTO configuration_values 
+        (key, value, value_type, environment, updated_at, updated_by)
+        VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, ?)
+        ON CONFLICT(key, environment) DO UPDATE SET
+            value = excluded.value,
+            value_type = excluded.value_type,
+            updated_at = CURRENT_TIMESTAMP,
+            updated_by = excluded.updated_by
+    """
+else:
+    _SQL_UPSERT_VALUE = """
+        INSERT OR REPLACE INTO configuration_values 
+        (key, value, value_type, environment, updated_at, updated_by)
+        VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, ?)
+    """
+
+
+def _deserialize_boolean(value_str: str) -> bool:
+    return value_str.lower() == "true"
+
+
+def _deserialize_null(value_str: str) -> None:
+    return None
+
+
+def _deserialize_identity(value_str: str) -> str:
+    return value_str
+
+
+# Stored value_type -> parser; unknown types come back as the raw string
+_DESERIALIZERS: Dict[str, Callable[[str], Any]] = {
+    "null": _deserialize_null,
+    "boolean": _deserialize_boolean,
+    "integer": int,
+    "float": float,
+    "string": _deserialize_identity,
+    "json": _json_loads,
+}
 
 
 class ConfigurationStore(ABC):
@@ -217,20 +488,180 @@ class ConfigurationStore(ABC):
     def list_keys(self, environment: str = None) -> List[str]:
         """List configuration keys"""
         pass
+    
+    @abstractmethod
+    def get_all(self, environment: str = None) -> Dict[str, Any]:
+        """Get all configuration values for an environment"""
+        pass
+    
+    @abstractmethod
+    def rollback(self, key: str, environment: str = None, steps: int = 1) -> Tuple[bool, Any]:
+        """Restore the value a key had before its last `steps` changes"""
+        pass
 
 
 class DatabaseConfigurationStore(ConfigurationStore):
-    """Database-backed configuration storage"""
+    """
+    Database-backed configuration storage
+    
+    Connections run in WAL mode so configuration reads are not blocked by
+    writes. WAL needs the database file on a local disk (not a network
+    filesystem).
+    """
+    
+    # Tuning applied to every pooled connection on top of the secure defaults
+    # (journal_mode=WAL, temp_store=MEMORY are already set there)
+    CONNECTION_PRAGMAS = (
+        "PRAGMA synchronous = NORMAL",  # Safe with WAL, avoids an fsync per commit
+        "PRAGMA temp_store = MEMORY",
+        "PRAGMA mmap_size = 268435456",  # 256MB memory-mapped I/O
+        "PRAGMA cache_size = -20000",  # ~20MB page cache
+    )
     
-    def __init__(self, database_path: str):
+    # Prepared statements kept per pooled connection (sqlite3 default is 128)
+    STATEMENT_CACHE_SIZE = 256
+    
+    # Keys per IN (...) query in get_many
+    GET_MANY_CHUNK_SIZE = 500
+    
+    def __init__(self, database_path: str,
+                 pool_min_size: int = 2,
+                 pool_max_size: int = 10,
+                 pool_timeout: float = DEFAULT_SQLITE_TIMEOUT):
         """Initialize database configuration store"""
         self.database_path = database_path
-        self._initialize_database()
+        self._db_path = Path(database_path)
+        
+        # Connection pool
+        self._pool_max_size = pool_max_size
+        self._pool_timeout = pool_timeout
+        self._pool: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=pool_max_size)
+        self._pool_lock = threading.Lock()
+        self._pool_total = 0
+        self._pool_active = 0
+        
+        # Schemas saved or loaded by this store, keyed by config key
+        self._schema_cache: Dict[str, ConfigSchema] = {}
+        
+        self._initialize_database(pool_min_size)
         logger.info("Initialized database configuration store")
     
-    def _initialize_database(self):
-        """Initialize configuration database tables"""
-        with secure_sqlite_connection(Path(self.database_path)) as conn:
+    def _reserve_slot(self) -> bool:
+        """Count a new connection against the pool size, if there is room for one"""
+        with self._pool_lock:
+            if self._pool_total >= self._pool_max_size:
+                return False
+            self._pool_total += 1
+            return True
+    
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a new pooled connection for a reserved slot, giving the slot back on failure"""
+        try:
+            conn = open_secure_sqlite_connection(
+                self._db_path, timeout=self._pool_timeout,
+                cached_statements=self.STATEMENT_CACHE_SIZE
+            )
+            try:
+                # Store code indexes rows positionally; plain tuples are cheaper than sqlite3.Row
+                conn.row_factory = None
+                for pragma in self.CONNECTION_PRAGMAS:
+                    conn.execute(pragma)
+            except Exception:
+                conn.close()
+                raise
+            return conn
+        except Exception:
+            with self._pool_lock:
+                self._pool_total -= 1
+            raise
+    
+    def _acquire_connection(self) -> sqlite3.Connection:
+        """Take an idle connection, open a new one below max size, or wait for one"""
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            # Reserve the slot in the same locked check so concurrent callers cannot overshoot
+            if self._reserve_slot():
+                conn = self._open_connection()
+            else:
+                try:
+                    conn = self._pool.get(timeout=self._pool_timeout)
+                except queue.Empty:
+                    raise TimeoutError(
+                        f"No configuration database connection available after {self._pool_timeout}s"
+                    )
+        
+        with self._pool_lock:
+            self._pool_active += 1
+        return conn
+    
+    def _release_connection(self, conn: sqlite3.Connection, discard: bool = False):
+        """Return a connection to the pool, or close it if discarded or surplus"""
+        with self._pool_lock:
+            self._pool_active -= 1
+        
+        if not discard:
+            try:
+                self._pool.put_nowait(conn)
+                return
+            except queue.Full:
+                logger.warning("Configuration database pool is full, closing surplus connection")
+        
+        with self._pool_lock:
+            self._pool_total -= 1
+        try:
+            conn.close()
+        except Exception as e:
+            logger.error(f"Error closing configuration database connection: {e}")
+    
+    @contextmanager
+    def _conn(self):
+        """Borrow a pooled connection; it is closed instead of returned if the caller fails"""
+        conn = self._acquire_connection()
+        try:
+            yield conn
+        except Exception:
+            self._release_connection(conn, discard=True)
+            raise
+        else:
+            self._release_connection(conn)
+    
+    def get_pool_status(self) -> Dict[str, int]:
+        """Get connection pool usage"""
+        with self._pool_lock:
+            return {
+                'active': self._pool_active,
+                'idle': self._pool.qsize(),
+                'total': self._pool_total,
+                'max_size': self._pool_max_size
+            }
+    
+    def close(self):
+        """Close all idle pooled connections"""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            with self._pool_lock:
+                self._pool_total -= 1
+            try:
+                conn.close()
+            except Exception as e:
+                logger.error(f"Error closing configuration database connection: {e}")
+    
+    def _initialize_database(self, pool_min_size: int = 2):
+        """Initialize configuration database tables and pre-fill the connection pool"""
+        for _ in range(min(pool_min_size, self._pool_max_size)):
+            if self._reserve_slot():
+                self._pool.put_nowait(self._open_connection())
+        
+        with self._conn() as conn:
+            # WAL is normally set on connect; make sure it actually took effect
+            journal_mode = conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+            if journal_mode.lower() != "wal":
+                logger.warning(f"Configuration database not in WAL mode (journal_mode={journal_mode})")
+            
             # Configuration values table
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS configuration_values (
@@ -273,18 +704,29 @@ class DatabaseConfigurationStore(ConfigurationStore):
                 )
             """)
             
+            # Indexes for history lookups and per-environment listing; the
+            # (key, environment) index carries the rowid, so it also yields
+            # newest-first (id DESC) order without a sort
+            conn.execute("DROP INDEX IF EXISTS idx_history_key_env_ts")  # superseded
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_history_key_env
+                ON configuration_history(key, environment)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_values_env
+                ON configuration_values(environment)
+            """)
+            
             conn.commit()
+            
+            # Refresh planner statistics so the indexes get used
+            conn.execute("ANALYZE")
     
     def get_value(self, key: str, environment: str = "default") -> Optional[Any]:
         """Get configuration value from database"""
         try:
-            with secure_sqlite_connection(Path(self.database_path)) as conn:
-                cursor = conn.execute("""
-                    SELECT value, value_type FROM configuration_values 
-                    WHERE key = ? AND environment = ?
-                """, (key, environment))
-                
-                row = cursor.fetchone()
+            with self._conn() as conn:
+                row = conn.execute(_SQL_GET_VALUE, (key, environment)).fetchone()
                 if row:
                     value_str, value_type = row
                     return self._deserialize_value(value_str, value_type)
@@ -298,33 +740,21 @@ class DatabaseConfigurationStore(ConfigurationStore):
                   changed_by: str = "system", reason: str = None) -> bool:
         """Set configuration value in database"""
         try:
-            with secure_sqlite_connection(Path(self.database_path)) as conn:
-                # Get old value for history
-                cursor = conn.execute("""
-                    SELECT value, value_type FROM configuration_values 
-                    WHERE key = ? AND environment = ?
-                """, (key, environment))
-                
-                old_row = cursor.fetchone()
-                old_value = old_row[0] if old_row else None
+            # Serialize new value
+            value_str, value_type = self._serialize_value(value)
+            
+            with self._conn() as conn:
+                # Take the write lock up front so the old value can't change underneath us
+                conn.execute("BEGIN IMMEDIATE")
                 
-                # Serialize new value
-                value_str, value_type = self._serialize_value(value)
+                # Record history, reading the old value inside the same statement
+                conn.execute(_SQL_INSERT_HISTORY_FOR_SET, (
+                    key, key, environment, value_str, value_type, environment,
+                    key, environment, changed_by, reason
+                ))
                 
                 # Insert or update value
-                conn.execute("""
-                    INSERT OR REPLACE INTO configuration_values 
-                    (key, value, value_type, environment, updated_at, updated_by)
-                    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP, ?)
-                """, (key, value_str, value_type, environment, changed_by))
-                
-                # Record history
-                change_type = "update" if old_row else "create"
-                conn.execute("""
-                    INSERT INTO configuration_history 
-                    (key, old_value, new_value, value_type, environment, change_type, changed_by, reason)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (key, old_value, value_str, value_type, environment, change_type, changed_by, reason))
+                conn.execute(_SQL_UPSERT_VALUE, (key, value_str, value_type, environment, changed_by))
                 
                 conn.commit()
                 logger.info(f"Set config value: {key} = {value} (env: {environment})")
@@ -334,33 +764,105 @@ class DatabaseConfigurationStore(ConfigurationStore):
             logger.error(f"Error setting config value {key}: {e}")
             return False
     
+    def set_values_bulk(self, items: List[Tuple[str, Any]], environment: str = "default",
+                        changed_by: str = "system", reason: str = None) -> bool:
+        """Set several configuration values in a single transaction (all or nothing)"""
+        try:
+            rows = [(key, *self._serialize_value(value)) for key, value in items]
+            
+            with self._conn() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                
+                # History first, so each row still sees its old value
+                conn.executemany(_SQL_INSERT_HISTORY_FOR_SET, [
+                    (key, key, environment, value_str, value_type, environment,
+                     key, environment, changed_by, reason)
+                    for key, value_str, value_type in rows
+                ])
+                conn.executemany(_SQL_UPSERT_VALUE, [
+                    (key, value_str, value_type, environment, changed_by)
+                    for key, value_str, value_type in rows
+                ])
+                
+                conn.commit()
+                logger.info(f"Set {len(rows)} config values (env: {environment})")
+                return True
+                
+        except Exception as e:
+            logger.error(f"Error setting config values in bulk: {e}")
+            return False
+    
+    def rollback(self, key: str, environment: str = "default", steps: int = 1,
+                 changed_by: str = "system", reason: str = None,
+                 validator: Optional[Callable[[Any], Tuple[bool, Optional[str]]]] = None
+                 ) -> Tuple[bool, Any]:
+        """
+        Restore the value a key had before its last `steps` changes, in one transaction.
+        
+        The target state is the new value recorded by the change `steps` entries
+        back in the history; if that change was a delete, or the key didn't exist
+        yet, the key is removed. Returns (success, restored value), where the
+        value is None when the key ends up unset.
+        """
+        try:
+            with self._conn() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                
+                available = conn.execute(_SQL_COUNT_HISTORY_UP_TO, (key, environment, steps)).fetchone()[0]
+                if available < steps:
+                    conn.rollback()
+                    logger.error(f"Not enough history to rollback {steps} steps for {key}")
+                    return False, None
+                
+                target = conn.execute(_SQL_HISTORY_AT_OFFSET, (key, environment, steps)).fetchone()
+                
+                if target is not None and target[2] != 'delete':
+                    value_str, value_type = target[0], target[1]
+                    value = self._deserialize_value(value_str, value_type)
+                    
+                    if validator is not None:
+                        is_valid, error = validator(value)
+                        if not is_valid:
+                            conn.rollback()
+                            logger.error(f"Cannot rollback {key}: {error}")
+                            return False, None
+                    
+                    conn.execute(_SQL_INSERT_HISTORY_FOR_SET, (
+                        key, key, environment, value_str, value_type, environment,
+                        key, environment, changed_by, reason
+                    ))
+                    conn.execute(_SQL_UPSERT_VALUE, (key, value_str, value_type, environment, changed_by))
+                else:
+                    value = None
+                    old_row = conn.execute(_SQL_GET_VALUE, (key, environment)).fetchone()
+                    if old_row:
+                        conn.execute(_SQL_DELETE_VALUE, (key, environment))
+                        conn.execute(_SQL_INSERT_HISTORY_FOR_DELETE,
+                                     (key, old_row[0], old_row[1], environment, changed_by, reason))
+                
+                conn.commit()
+                return True, value
+                
+        except Exception as e:
+            logger.error(f"Error rolling back config value {key}: {e}")
+            return False, None
+    
     def delete_value(self, key: str, environment: str = "default", 
                      changed_by: str = "system", reason: str = None) -> bool:
         """Delete configuration value"""
         try:
-            with secure_sqlite_connection(Path(self.database_path)) as conn:
+            with self._conn() as conn:
                 # Get old value for history
-                cursor = conn.execute("""
-                    SELECT value, value_type FROM configuration_values 
-                    WHERE key = ? AND environment = ?
-                """, (key, environment))
-                
-                old_row = cursor.fetchone()
+                old_row = conn.execute(_SQL_GET_VALUE, (key, environment)).fetchone()
                 if not old_row:
                     return False
                 
                 # Delete value
-                conn.execute("""
-                    DELETE FROM configuration_values 
-                    WHERE key = ? AND environment = ?
-                """, (key, environment))
+                conn.execute(_SQL_DELETE_VALUE, (key, environment))
                 
                 # Record history
-                conn.execute("""
-                    INSERT INTO configuration_history 
-                    (key, old_value, new_value, value_type, environment, change_type, changed_by, reason)
-                    VALUES (?, ?, NULL, ?, ?, 'delete', ?, ?)
-                """, (key, old_row[0], old_row[1], environment, changed_by, reason))
+                conn.execute(_SQL_INSERT_HISTORY_FOR_DELETE,
+                             (key, old_row[0], old_row[1], environment, changed_by, reason))
                 
                 conn.commit()
                 logger.info(f"Deleted config value: {key} (env: {environment})")
@@ -370,15 +872,62 @@ class DatabaseConfigurationStore(ConfigurationStore):
             logger.error(f"Error deleting config value {key}: {e}")
             return False
     
+    def get_many(self, keys: List[str], environment: str = "default") -> Dict[str, Any]:
+        """Get the stored values for several keys; keys with no value are omitted"""
+        values = {}
+        try:
+            with self._conn() as conn:
+                # Chunked to stay under SQLite's bound-parameter limit
+                for start in range(0, len(keys), self.GET_MANY_CHUNK_SIZE):
+                    chunk = keys[start:start + self.GET_MANY_CHUNK_SIZE]
+                    placeholders = ", ".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT key, value, value_type FROM configuration_values "
+                        f"WHERE environment = ? AND key IN ({placeholders})",
+                        (environment, *chunk)
+                    ).fetchall()
+                    for key, value_str, value_type in rows:
+                        values[key] = self._deserialize_value(value_str, value_type)
+            
+        except Exception as e:
+            logger.error(f"Error getting config values: {e}")
+        
+        return values
+    
+    def count_keys(self, environment: str = "default") -> int:
+        """Count configuration keys; raises on database errors so callers can report them"""
+        with self._conn() as conn:
+            return conn.execute(_SQL_COUNT_KEYS, (environment,)).fetchone()[0]
+    
+    def get_all(self, environment: str = "default") -> Dict[str, Any]:
+        """Get all configuration values for an environment in one query, ordered by key"""
+        try:
+            with self._conn() as conn:
+                rows = conn.execute(_SQL_GET_ALL_VALUES, (environment,)).fetchall()
+            
+            return {
+                key: self._deserialize_value(value_str, value_type)
+                for key, value_str, value_type in rows
+            }
+            
+        except Exception as e:
+            logger.error(f"Error getting config values for {environment}: {e}")
+            return {}
+    
+    def get_last_change_id(self) -> Optional[int]:
+        """Id of the newest history row, which changes whenever any value is written"""
+        try:
+            with self._conn() as conn:
+                return conn.execute(_SQL_LAST_CHANGE_ID).fetchone()[0]
+        except Exception as e:
+            logger.error(f"Error reading config change marker: {e}")
+            return None
+    
     def list_keys(self, environment: str = "default") -> List[str]:
         """List configuration keys"""
         try:
-            with secure_sqlite_connection(Path(self.database_path)) as conn:
-                cursor = conn.execute("""
-                    SELECT key FROM configuration_values 
-                    WHERE environment = ? 
-                    ORDER BY key
-                """, (environment,))
+            with self._conn() as conn:
+                cursor = conn.execute(_SQL_LIST_KEYS, (environment,))
                 
                 return [row[0] for row in cursor.fetchall()]
                 
@@ -387,10 +936,10 @@ class DatabaseConfigurationStore(ConfigurationStore):
             return []
     
     def get_history(self, key: str = None, environment: str = None, 
-                   limit: int = 100) -> List[Dict[str, Any]]:
-        """Get configuration change history"""
+                   limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+        """Get configuration change history, newest first; `offset` skips entries for paging"""
         try:
-            with secure_sqlite_connection(Path(self.database_path)) as conn:
+            with self._conn() as conn:
                 query = """
                     SELECT key, old_value, new_value, value_type, environment, 
                            change_type, timestamp, changed_by, reason
@@ -409,8 +958,9 @@ class DatabaseConfigurationStore(ConfigurationStore):
                 if conditions:
                     query += " WHERE " + " AND ".join(conditions)
                 
-                query += " ORDER BY timestamp DESC LIMIT ?"
-                params.append(limit)
+                # Ids follow write order; timestamps only have one-second resolution
+                query += " ORDER BY id DESC LIMIT ? OFFSET ?"
+                params.extend((limit, offset))
                 
                 cursor = conn.execute(query, params)
                 
@@ -433,20 +983,28 @@ class DatabaseConfigurationStore(ConfigurationStore):
             logger.error(f"Error getting config history: {e}")
             return []
     
+    def get_history_at(self, key: str, environment: str, step: int) -> Optional[Dict[str, Any]]:
+        """Get the single history entry `step` changes back (0 = most recent), or None"""
+        entries = self.get_history(key, environment, limit=1, offset=step)
+        return entries[0] if entries else None
+    
     def store_schema(self, schema: ConfigSchema) -> bool:
         """Store configuration schema"""
         try:
-            with secure_sqlite_connection(Path(self.database_path)) as conn:
-                schema_json = json.dumps(schema.dict(), cls=ConfigJSONEncoder)
-                
-                conn.execute("""
-                    INSERT OR REPLACE INTO configuration_schemas 
-                    (key, schema_json, updated_at)
-                    VALUES (?, ?, CURRENT_TIMESTAMP)
-                """, (schema.key, schema_json))
+            schema_json = schema.to_json()
+            
+            # Nothing to write if this store already saved an identical schema
+            cached = self._schema_cache.get(schema.key)
+            if cached is not None and cached.to_json() == schema_json:
+                return True
+            
+            with self._conn() as conn:
+                conn.execute(_SQL_STORE_SCHEMA, (schema.key, schema_json))
                 
                 conn.commit()
-                return True
+            
+            self._schema_cache[schema.key] = schema
+            return True
                 
         except Exception as e:
             logger.error(f"Error storing schema for {schema.key}: {e}")
@@ -454,16 +1012,19 @@ class DatabaseConfigurationStore(ConfigurationStore):
     
     def get_schema(self, key: str) -> Optional[ConfigSchema]:
         """Get configuration schema"""
+        cached = self._schema_cache.get(key)
+        if cached is not None:
+            return cached
+        
         try:
-            with secure_sqlite_connection(Path(self.database_path)) as conn:
-                cursor = conn.execute("""
-                    SELECT schema_json FROM configuration_schemas WHERE key = ?
-                """, (key,))
-                
-                row = cursor.fetchone()
-                if row:
-                    schema_data = json.loads(row[0])
-                    return ConfigSchema(**schema_data)
+            with self._conn() as conn:
+                row = conn.execute(_SQL_GET_SCHEMA, (key,)).fetchone()
+            
+            if row:
+                schema_data = _json_loads(row[0])
+                schema = ConfigSchema(**schema_data)
+                self._schema_cache[key] = schema
+                return schema
                 
         except Exception as e:
             logger.error(f"Error getting schema for {key}: {e}")
@@ -484,24 +1045,139 @@ class DatabaseConfigurationStore(ConfigurationStore):
             return value, "string"
         else:
             # JSON serialize complex types
-            return json.dumps(value), "json"
+            return _json_dumps(value), "json"
     
     def _deserialize_value(self, value_str: str, value_type: str) -> Any:
         """Deserialize value from database"""
-        if value_str is None or value_type == "null":
+        if value_str is None:
             return None
-        elif value_type == "boolean":
-            return value_str.lower() == "true"
-        elif value_type == "integer":
-            return int(value_str)
-        elif value_type == "float":
-            return float(value_str)
-        elif value_type == "string":
-            return value_str
-        elif value_type == "json":
-            return json.loads(value_str)
-        else:
-            return value_str
+        return _DESERIALIZERS.get(value_type, _deserialize_identity)(value_str)
+
+
+# Built once at import; every manager registers these same instances
+_DEFAULT_SCHEMAS: Tuple[ConfigSchema, ...] = (
+    ConfigSchema(
+        key="app.name",
+        display_name="Application Name",
+        description="Name of the application",
+        value_type=ConfigValueType.STRING,
+        default_value="Zenith AI",
+        category="application"
+    ),
+    ConfigSchema(
+        key="app.port",
+        display_name="Application Port",
+        description="Port for the web server",
+        value_type=ConfigValueType.INTEGER,
+        default_value=8501,
+        validation_rules=[{
+            'rule_type': 'range',
+            'parameters': {'min': 1024, 'max': 65535}
+        }],
+        category="server"
+    ),
+    ConfigSchema(
+        key="database.url",
+        display_name="Database URL",
+        description="Database connection URL",
+        value_type=ConfigValueType.URL,
+        default_value="sqlite:///./data/zenith.db",
+        category="database"
+    ),
+    ConfigSchema(
+        key="qdrant.url",
+        display_name="Qdrant URL",
+        description="Qdrant vector database URL",
+        value_type=ConfigValueType.URL,
+        default_value="http://localhost:6333",
+        category="vector_database"
+    ),
+    ConfigSchema(
+        key="openai.api_key",
+        display_name="OpenAI API Key",
+        description="OpenAI API key for chat and embeddings",
+        value_type=ConfigValueType.SECRET,
+        is_secret=True,
+        is_required=False,
+        category="ai_providers"
+    ),
+    ConfigSchema(
+        key="security.jwt_secret",
+        display_name="JWT Secret Key",
+        description="Secret key for JWT token signing",
+        value_type=ConfigValueType.SECRET,
+        is_secret=True,
+        is_required=True,
+        category="security"
+    ),
+    ConfigSchema(
+        key="logging.level",
+        display_name="Logging Level",
+        description="Application logging level",
+        value_type=ConfigValueType.STRING,
+        default_value="INFO",
+        validation_rules=[{
+            'rule_type': 'choices',
+            'parameters': {'choices': ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']}
+        }],
+        category="logging"
+    ),
+)
+
+
+_NS_PER_SECOND = 1_000_000_000
+
+# Marks "no stored value" where None is itself a valid value
+_MISSING = object()
+
+# Power of two so a key's shard is a mask of its hash
+_CACHE_SHARD_COUNT = 16
+
+
+class _CacheShard:
+    """One slice of the config cache: a size-bounded LRU of key -> (value, deadline_ns) with its own lock"""
+    __slots__ = ('entries', 'lock', 'epoch', 'max_size')
+    
+    def __init__(self, max_size: int):
+        self.entries: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self.lock = threading.Lock()
+        # Bumped by every invalidation; a read that started before a write must
+        # not put its (now stale) value back into the cache
+        self.epoch = 0
+        self.max_size = max_size
+    
+    def get(self, key: str, now_ns: int) -> Optional[Tuple[Any, int]]:
+        """Live entry for key, or None if missing or expired"""
+        # One unlocked dict probe; the lock is only taken for the LRU bump on a hit
+        entry = self.entries.get(key)
+        if entry is None or entry[1] <= now_ns:
+            return None
+        with self.lock:
+            try:
+                self.entries.move_to_end(key)
+            except KeyError:
+                pass  # Evicted or invalidated since the read; still a valid hit
+        return entry
+    
+    def put(self, key: str, value: Any, deadline_ns: int, epoch: int):
+        """Insert an entry read at `epoch`; skipped if the shard was invalidated since"""
+        with self.lock:
+            if epoch != self.epoch:
+                return
+            self.entries[key] = (value, deadline_ns)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+    
+    def invalidate(self, key: str):
+        with self.lock:
+            self.entries.pop(key, None)
+            self.epoch += 1
+    
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.epoch += 1
 
 
 class EnhancedConfigurationManager:
@@ -510,7 +1186,8 @@ class EnhancedConfigurationManager:
     def __init__(self, 
                  database_path: str,
                  environment: str = "development",
-                 enable_hot_reload: bool = True):
+                 enable_hot_reload: bool = True,
+                 cache_max_size: int = 1024):
         """Initialize enhanced configuration manager"""
         self.database_path = database_path
         self.environment = environment
@@ -519,23 +1196,39 @@ class EnhancedConfigurationManager:
         # Initialize storage
         self.store = DatabaseConfigurationStore(database_path)
         
-        # Configuration cache
-        self._config_cache: Dict[str, Any] = {}
-        self._cache_timestamp: Dict[str, datetime] = {}
-        self._cache_ttl = timedelta(seconds=60)  # Cache for 60 seconds
+        # Configuration cache, sharded by key hash so concurrent readers and
+        # writers of different keys don't contend on one lock
+        shard_max = max(1, -(-cache_max_size // _CACHE_SHARD_COUNT))
+        self._cache_shards = tuple(_CacheShard(shard_max) for _ in range(_CACHE_SHARD_COUNT))
+        # Deadlines are integer nanoseconds on the monotonic clock
+        self._cache_ttl_ns = 60 * _NS_PER_SECOND  # Cache for 60 seconds
+        # Up to 10% extra per entry so keys cached together don't all expire together
+        self._cache_ttl_jitter_ns = self._cache_ttl_ns // 10
+        
+        # Resolved secrets: secret key -> (value, monotonic deadline in ns). Misses
+        # are filled under a per-key lock so concurrent readers share one lookup.
+        self._secret_cache: Dict[str, Tuple[str, int]] = {}
+        self._secret_locks: Dict[str, threading.Lock] = {}
+        self._secret_locks_guard = threading.Lock()
+        self._secret_ttl_ns = 60 * _NS_PER_SECOND
+        # Secrets manager handle, fetched on first use and reused afterwards
+        self._secrets_manager = None
         
         # Schema registry
         self._schemas: Dict[str, ConfigSchema] = {}
         
-        # Change callbacks
-        self._change_callbacks: Dict[str, List[Callable]] = {}
+        # Change callbacks; the lock guards registration and snapshotting only.
+        # Callbacks run on a single dispatch thread so slow ones don't stall
+        # writers while notifications are still delivered in write order.
+        self._change_callbacks: Dict[str, List[Union[Callable, weakref.WeakMethod]]] = {}
+        self._cb_lock = threading.RLock()
+        self._cb_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="config-callbacks")
         
-        # Hot reload thread
-        self._reload_thread = None
-        self._reload_stop_event = threading.Event()
-        
-        if enable_hot_reload:
-            self._start_hot_reload()
+        # Hot reload: drop the cache when the database changed underneath us,
+        # checked lazily from get_config at most once per interval
+        self._change_check_interval_ns = _NS_PER_SECOND
+        self._next_change_check_ns = 0
+        self._last_change_id = self.store.get_last_change_id() if enable_hot_reload else None
         
         # Initialize with default schemas
         self._register_default_schemas()
@@ -549,7 +1242,8 @@ class EnhancedConfigurationManager:
             if not schema.key:
                 raise ValueError("Schema key is required")
             
-            # Store schema
+            # Build the specialized validator up front, then store schema
+            schema.compile_validator()
             self._schemas[schema.key] = schema
             success = self.store.store_schema(schema)
             
@@ -569,74 +1263,115 @@ class EnhancedConfigurationManager:
         cache_key = f"{key}:{env}"
         
         # Check cache
-        if use_cache and cache_key in self._config_cache:
-            if (cache_key in self._cache_timestamp and 
-                datetime.now() - self._cache_timestamp[cache_key] < self._cache_ttl):
-                return self._config_cache[cache_key]
+        if use_cache:
+            if self.enable_hot_reload:
+                self._check_external_changes()
+            shard = self._cache_shard(cache_key)
+            entry = shard.get(cache_key, time.monotonic_ns())
+            if entry is not None:
+                return entry[0]
+            epoch = shard.epoch
         
         # Get value from store
-        value = self.store.get_value(key, env)
+        value = self._prepare_value(key, self.store.get_value(key, env), default,
+                                    self._schemas.get(key))
         
+        # Update cache
+        if use_cache:
+            self._cache_put(shard, cache_key, value, epoch)
+        
+        return value
+    
+    def _prepare_value(self, key: str, value: Any, default: Any,
+                       schema: Optional[ConfigSchema]) -> Any:
+        """Apply defaults, secret resolution and schema validation to a stored value"""
         # Use default if no value found
         if value is None:
-            schema = self._schemas.get(key)
             if schema and schema.default_value is not None:
                 value = schema.default_value
             else:
                 value = default
         
-        # Handle secrets
-        if value is not None and self._is_secret_reference(value):
-            value = self._resolve_secret_reference(value)
+        # Handle secrets; the resolved value is what gets cached, so cache
+        # hits never go back to the secrets manager
+        value = self._maybe_resolve_secret(value)
         
         # Validate against schema if available
-        schema = self._schemas.get(key)
         if schema and value is not None:
             is_valid, error = schema.validate_value(value)
             if not is_valid:
                 logger.warning(f"Invalid config value for {key}: {error}. Using default.")
                 value = schema.default_value if schema.default_value is not None else default
         
-        # Update cache
-        if use_cache:
-            self._config_cache[cache_key] = value
-            self._cache_timestamp[cache_key] = datetime.now()
-        
         return value
     
+    def _check_external_changes(self):
+        """Clear the cache if the store has been written since the last check"""
+        now_ns = time.monotonic_ns()
+        if now_ns < self._next_change_check_ns:
+            return
+        self._next_change_check_ns = now_ns + self._change_check_interval_ns
+        
+        change_id = self.store.get_last_change_id()
+        if change_id != self._last_change_id:
+            self._last_change_id = change_id
+            for shard in self._cache_shards:
+                shard.clear()
+    
+    def _cache_shard(self, cache_key: str) -> _CacheShard:
+        """Shard holding a cache key"""
+        return self._cache_shards[hash(cache_key) & (_CACHE_SHARD_COUNT - 1)]
+    
+    def _cache_put(self, shard: _CacheShard, cache_key: str, value: Any, epoch: int):
+        """Cache a value read at the shard's `epoch`, with a jittered TTL"""
+        deadline_ns = (time.monotonic_ns() + self._cache_ttl_ns
+                       + random.randrange(self._cache_ttl_jitter_ns))
+        shard.put(cache_key, value, deadline_ns, epoch)
+    
+    def _cache_invalidate(self, *cache_keys: str):
+        """Drop cache entries after a write"""
+        for cache_key in cache_keys:
+            self._cache_shard(cache_key).invalidate(cache_key)
+    
     def set_config(self, key: str, value: Any, environment: str = None,
                    changed_by: str = "system", reason: str = None,
                    validate: bool = True) -> bool:
         """Set configuration value with validation"""
+        return self.set_config_bulk([(key, value)], environment, changed_by, reason, validate)
+    
+    def set_config_bulk(self, items: List[Tuple[str, Any]], environment: str = None,
+                        changed_by: str = "system", reason: str = None,
+                        validate: bool = True) -> bool:
+        """Set several configuration values in one transaction (all or nothing)"""
         env = environment or self.environment
         
-        # Validate against schema if available
+        # Validate against schemas if available
         if validate:
-            schema = self._schemas.get(key)
-            if schema:
-                is_valid, error = schema.validate_value(value)
-                if not is_valid:
-                    logger.error(f"Invalid config value for {key}: {error}")
-                    return False
-                
-                # Check if readonly
-                if schema.is_readonly:
-                    logger.error(f"Cannot modify readonly config: {key}")
-                    return False
+            for key, value in items:
+                schema = self._schemas.get(key)
+                if schema:
+                    is_valid, error = schema.validate_value(value)
+                    if not is_valid:
+                        logger.error(f"Invalid config value for {key}: {error}")
+                        return False
+                    
+                    # Check if readonly
+                    if schema.is_readonly:
+                        logger.error(f"Cannot modify readonly config: {key}")
+                        return False
         
-        # Store value
-        success = self.store.set_value(key, value, env, changed_by, reason)
+        # Store values
+        success = self.store.set_values_bulk(items, env, changed_by, reason)
         
         if success:
-            # Invalidate cache
-            cache_key = f"{key}:{env}"
-            self._config_cache.pop(cache_key, None)
-            self._cache_timestamp.pop(cache_key, None)
-            
-            # Trigger change callbacks
-            self._trigger_change_callbacks(key, value, env)
+            # Invalidate cache for the whole batch before anyone is notified
+            self._cache_invalidate(*(f"{key}:{env}" for key, _ in items))
             
-            logger.info(f"Updated config: {key} (env: {env})")
+            for key, value in items:
+                # Trigger change callbacks once the write has committed
+                self._trigger_change_callbacks(key, value, env)
+                
+                logger.info(f"Updated config: {key} (env: {env})")
         
         return success
     
@@ -656,8 +1391,7 @@ class EnhancedConfigurationManager:
         if success:
             # Invalidate cache
             cache_key = f"{key}:{env}"
-            self._config_cache.pop(cache_key, None)
-            self._cache_timestamp.pop(cache_key, None)
+            self._cache_invalidate(cache_key)
             
             # Trigger change callbacks
             self._trigger_change_callbacks(key, None, env)
@@ -686,14 +1420,15 @@ class EnhancedConfigurationManager:
         if not schema:
             return None
         
-        current_value = self.get_config(key)
+        # Secrets are redacted, so don't resolve them just to throw the value away
+        current_value = "[REDACTED]" if schema.is_secret else self.get_config(key)
         
         return {
             'key': key,
             'display_name': schema.display_name,
             'description': schema.description,
             'value_type': schema.value_type.value,
-            'current_value': current_value if not schema.is_secret else "[REDACTED]",
+            'current_value': current_value,
             'default_value': schema.default_value,
             'is_required': schema.is_required,
             'is_secret': schema.is_secret,
@@ -709,21 +1444,25 @@ class EnhancedConfigurationManager:
     def export_config(self, environment: str = None, format: str = "json") -> str:
         """Export configuration to string format"""
         env = environment or self.environment
-        keys = self.list_configs(env)
         
+        # One query for the whole environment instead of a lookup per key
         config_data = {}
-        for key in keys:
-            value = self.get_config(key, environment=env)
+        epochs = {id(shard): shard.epoch for shard in self._cache_shards}
+        for key, stored in self.store.get_all(env).items():
             schema = self._schemas.get(key)
             
             # Don't export secrets
             if schema and schema.is_secret:
                 config_data[key] = "[REDACTED]"
             else:
+                value = self._prepare_value(key, stored, None, schema)
                 config_data[key] = value
+                cache_key = f"{key}:{env}"
+                shard = self._cache_shard(cache_key)
+                self._cache_put(shard, cache_key, value, epochs[id(shard)])
         
         if format.lower() == "yaml":
-            return yaml.dump(config_data, default_flow_style=False)
+            return yaml.dump(config_data, Dumper=_YamlDumper, default_flow_style=False)
         else:
             return json.dumps(config_data, indent=2, default=str)
     
@@ -737,9 +1476,9 @@ class EnhancedConfigurationManager:
         try:
             # Parse configuration data
             if format.lower() == "yaml":
-                data = yaml.safe_load(config_data)
+                data = yaml.load(config_data, Loader=_YamlLoader)
             else:
-                data = json.loads(config_data)
+                data = _json_loads(config_data)
             
             if not isinstance(data, dict):
                 return False, ["Configuration data must be a dictionary"]
@@ -764,14 +1503,26 @@ class EnhancedConfigurationManager:
                     messages.append(f"  - {key}")
                 return True, messages
             
-            # Import values
-            success_count = 0
+            # Only write keys whose value actually differs from what's stored, so
+            # re-applying the same config doesn't add history or fire callbacks
+            current = self.store.get_many(list(data.keys()), env)
+            changed = []
             for key, value in data.items():
-                if self.set_config(key, value, env, changed_by, f"Bulk import"):
-                    success_count += 1
-                    messages.append(f"Imported: {key}")
+                stored = current.get(key, _MISSING)
+                if type(stored) is type(value) and stored == value:
+                    messages.append(f"Unchanged: {key}")
                 else:
-                    messages.append(f"Failed to import: {key}")
+                    changed.append((key, value))
+            
+            # Import values in one transaction; they were validated above, so
+            # skip set_config_bulk's own validation pass
+            if not changed or self.set_config_bulk(changed, env, changed_by, "Bulk import",
+                                                   validate=False):
+                success_count = len(data)
+                messages.extend(f"Imported: {key}" for key, _ in changed)
+            else:
+                success_count = len(data) - len(changed)
+                messages.extend(f"Failed to import: {key}" for key, _ in changed)
             
             messages.append(f"Successfully imported {success_count}/{len(data)} configurations")
             return success_count == len(data), messages
@@ -784,183 +1535,118 @@ class EnhancedConfigurationManager:
         """Rollback configuration to previous value"""
         env = environment or self.environment
         
-        try:
-            # Get history
-            history = self.store.get_history(key, env, steps + 1)
-            
-            if len(history) <= steps:
-                logger.error(f"Not enough history to rollback {steps} steps for {key}")
-                return False
-            
-            # Get target value
-            target_entry = history[steps]
-            if target_entry['change_type'] == 'delete':
-                # If target was a delete, we need to go further back
-                target_value = None
-                for entry in history[steps:]:
-                    if entry['change_type'] in ['create', 'update']:
-                        target_value = self.store._deserialize_value(
-                            entry['new_value'], entry['value_type']
-                        )
-                        break
-            else:
-                target_value = self.store._deserialize_value(
-                    target_entry['old_value'], target_entry['value_type']
-                )
-            
-            # Set value
-            if target_value is not None:
-                success = self.set_config(key, target_value, env, "system", 
-                                        f"Rollback {steps} steps")
-            else:
-                success = self.delete_config(key, env, "system", 
-                                           f"Rollback {steps} steps (delete)")
-            
-            if success:
-                logger.info(f"Rolled back config {key} by {steps} steps")
-            
-            return success
-            
-        except Exception as e:
-            logger.error(f"Rollback failed for {key}: {e}")
+        schema = self._schemas.get(key)
+        if schema and schema.is_readonly:
+            logger.error(f"Cannot modify readonly config: {key}")
             return False
+        
+        # Target lookup and write happen in a single store transaction
+        success, value = self.store.rollback(
+            key, env, steps, "system", f"Rollback {steps} steps",
+            validator=schema.validate_value if schema else None
+        )
+        
+        if success:
+            self._cache_invalidate(f"{key}:{env}")
+            self._trigger_change_callbacks(key, value, env)
+            logger.info(f"Rolled back config {key} by {steps} steps")
+        
+        return success
     
     def register_change_callback(self, key: str, callback: Callable):
-        """Register callback for configuration changes"""
-        if key not in self._change_callbacks:
-            self._change_callbacks[key] = []
+        """
+        Register callback for configuration changes.
         
-        self._change_callbacks[key].append(callback)
+        Bound methods are held weakly, so registering one doesn't keep its
+        object alive; it is dropped once the object is collected. Plain
+        functions and lambdas are held strongly, as they often have no other
+        reference.
+        """
+        entry = weakref.WeakMethod(callback) if inspect.ismethod(callback) else callback
+        with self._cb_lock:
+            self._change_callbacks.setdefault(key, []).append(entry)
         logger.debug(f"Registered change callback for {key}")
     
     def _trigger_change_callbacks(self, key: str, new_value: Any, environment: str):
         """Trigger change callbacks for key"""
-        callbacks = self._change_callbacks.get(key, [])
+        with self._cb_lock:
+            entries = self._change_callbacks.get(key)
+            if not entries:
+                return
+            
+            callbacks = []
+            live_entries = []
+            for entry in entries:
+                callback = entry() if isinstance(entry, weakref.WeakMethod) else entry
+                if callback is not None:
+                    callbacks.append(callback)
+                    live_entries.append(entry)
+            
+            # Prune callbacks whose owners have been garbage collected
+            if len(live_entries) != len(entries):
+                self._change_callbacks[key] = live_entries
         
+        try:
+            self._cb_executor.submit(self._run_change_callbacks, tuple(callbacks),
+                                     key, new_value, environment)
+        except RuntimeError as e:
+            # Executor already shut down
+            logger.error(f"Dropped change callbacks for {key}: {e}")
+    
+    @staticmethod
+    def _run_change_callbacks(callbacks: Tuple[Callable, ...], key: str,
+                              new_value: Any, environment: str):
+        """Invoke callbacks for one change; a failing callback doesn't stop the rest"""
         for callback in callbacks:
             try:
                 callback(key, new_value, environment)
             except Exception as e:
                 logger.error(f"Error in change callback for {key}: {e}")
     
-    def _is_secret_reference(self, value: Any) -> bool:
-        """Check if value is a secret reference"""
-        return (isinstance(value, str) and 
-                value.startswith("${secret:") and 
-                value.endswith("}"))
-    
-    def _resolve_secret_reference(self, value: str) -> Optional[str]:
-        """Resolve secret reference to actual value"""
+    def _maybe_resolve_secret(self, value: Any) -> Any:
+        """Resolve a ${secret:key} reference; any other value is returned unchanged"""
+        # Cheap rejects first so ordinary values never reach the regex
+        if not isinstance(value, str) or not value.startswith(_SECRET_PREFIX):
+            return value
+        match = _SECRET_RE.fullmatch(value)
+        if match is None:
+            return value
+        
         try:
-            # Extract secret key from ${secret:key} format
-            secret_key = value[9:-1]  # Remove "${secret:" and "}"
-            
-            secrets_manager = get_secrets_manager()
-            return secrets_manager.retrieve_secret(secret_key)
+            return self._retrieve_secret(match.group(1))
             
         except Exception as e:
             logger.error(f"Failed to resolve secret reference {value}: {e}")
             return None
     
-    def _start_hot_reload(self):
-        """Start hot reload monitoring thread"""
-        def hot_reload_worker():
-            while not self._reload_stop_event.is_set():
-                try:
-                    # Clear cache periodically to pick up external changes
-                    if self._config_cache:
-                        current_time = datetime.now()
-                        expired_keys = [
-                            key for key, timestamp in self._cache_timestamp.items()
-                            if current_time - timestamp > self._cache_ttl
-                        ]
-                        
-                        for key in expired_keys:
-                            self._config_cache.pop(key, None)
-                            self._cache_timestamp.pop(key, None)
-                    
-                    time.sleep(30)  # Check every 30 seconds
-                    
-                except Exception as e:
-                    logger.error(f"Hot reload error: {e}")
-                    time.sleep(60)  # Wait longer on error
+    def _retrieve_secret(self, secret_key: str) -> Optional[str]:
+        """Fetch a secret, sharing one secrets manager call among concurrent readers"""
+        entry = self._secret_cache.get(secret_key)
+        if entry is not None and entry[1] > time.monotonic_ns():
+            return entry[0]
+        
+        with self._secret_locks_guard:
+            lock = self._secret_locks.setdefault(secret_key, threading.Lock())
         
-        self._reload_thread = threading.Thread(target=hot_reload_worker, daemon=True)
-        self._reload_thread.start()
-        logger.info("Started configuration hot reload monitoring")
+        with lock:
+            # Another reader may have filled it while we waited
+            entry = self._secret_cache.get(secret_key)
+            if entry is not None and entry[1] > time.monotonic_ns():
+                return entry[0]
+            
+            if self._secrets_manager is None:
+                self._secrets_manager = get_secrets_manager()
+            secret = self._secrets_manager.retrieve_secret(secret_key)
+            # Only found secrets are cached, so a newly stored one shows up right away
+            if secret is not None:
+                deadline_ns = (time.monotonic_ns() + self._secret_ttl_ns
+                               + random.randrange(self._secret_ttl_ns // 10))
+                self._secret_cache[secret_key] = (secret, deadline_ns)
+            return secret
     
     def _register_default_schemas(self):
         """Register default configuration schemas"""
-        default_schemas = [
-            ConfigSchema(
-                key="app.name",
-                display_name="Application Name",
-                description="Name of the application",
-                value_type=ConfigValueType.STRING,
-                default_value="Zenith AI",
-                category="application"
-            ),
-            ConfigSchema(
-                key="app.port",
-                display_name="Application Port",
-                description="Port for the web server",
-                value_type=ConfigValueType.INTEGER,
-                default_value=8501,
-                validation_rules=[{
-                    'rule_type': 'range',
-                    'parameters': {'min': 1024, 'max': 65535}
-                }],
-                category="server"
-            ),
-            ConfigSchema(
-                key="database.url",
-                display_name="Database URL",
-                description="Database connection URL",
-                value_type=ConfigValueType.URL,
-                default_value="sqlite:///./data/zenith.db",
-                category="database"
-            ),
-            ConfigSchema(
-                key="qdrant.url",
-                display_name="Qdrant URL",
-                description="Qdrant vector database URL",
-                value_type=ConfigValueType.URL,
-                default_value="http://localhost:6333",
-                category="vector_database"
-            ),
-            ConfigSchema(
-                key="openai.api_key",
-                display_name="OpenAI API Key",
-                description="OpenAI API key for chat and embeddings",
-                value_type=ConfigValueType.SECRET,
-                is_secret=True,
-                is_required=False,
-                category="ai_providers"
-            ),
-            ConfigSchema(
-                key="security.jwt_secret",
-                display_name="JWT Secret Key",
-                description="Secret key for JWT token signing",
-                value_type=ConfigValueType.SECRET,
-                is_secret=True,
-                is_required=True,
-                category="security"
-            ),
-            ConfigSchema(
-                key="logging.level",
-                display_name="Logging Level",
-                description="Application logging level",
-                value_type=ConfigValueType.STRING,
-                default_value="INFO",
-                validation_rules=[{
-                    'rule_type': 'choices',
-                    'parameters': {'choices': ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']}
-                }],
-                category="logging"
-            )
-        ]
-        
-        for schema in default_schemas:
+        for schema in _DEFAULT_SCHEMAS:
             self.register_schema(schema)
     
     def health_check(self) -> Dict[str, Any]:
@@ -968,18 +1654,18 @@ class EnhancedConfigurationManager:
         status = {
             'database_accessible': False,
             'schemas_loaded': len(self._schemas),
-            'cache_entries': len(self._config_cache),
-            'hot_reload_active': self.enable_hot_reload and self._reload_thread and self._reload_thread.is_alive(),
+            'cache_entries': sum(len(shard.entries) for shard in self._cache_shards),
+            'hot_reload_active': self.enable_hot_reload,
             'environment': self.environment,
             'available_backends': 1,
+            'connection_pool': self.store.get_pool_status(),
             'errors': []
         }
         
         try:
-            # Test database access
-            test_keys = self.store.list_keys(self.environment)
+            # Test database access with a single COUNT(*) instead of listing every key
+            status['total_configs'] = self.store.count_keys(self.environment)
             status['database_accessible'] = True
-            status['total_configs'] = len(test_keys)
             
         except Exception as e:
             status['errors'].append(f"Database error: {e}")
@@ -988,28 +1674,31 @@ class EnhancedConfigurationManager:
     
     def shutdown(self):
         """Shutdown configuration manager"""
-        if self._reload_thread:
-            self._reload_stop_event.set()
-            self._reload_thread.join(timeout=5)
-        
+        # Deliver pending change notifications before closing the store
+        self._cb_executor.shutdown(wait=True)
+        self.store.close()
         logger.info("Configuration manager shut down")
 
 
 # Global configuration manager instance
 _config_manager: Optional[EnhancedConfigurationManager] = None
+_config_manager_lock = threading.Lock()
 
 
 def get_config_manager(database_path: str = None, environment: str = None) -> EnhancedConfigurationManager:
     """Get global configuration manager instance"""
     global _config_manager
     
+    # Double-checked: after the first call this is an unlocked None check
     if _config_manager is None:
-        if database_path is None:
-            raise ValueError("Database path required for first initialization")
-        _config_manager = EnhancedConfigurationManager(
-            database_path, 
-            environment or os.getenv('ZENITH_ENV', 'development')
-        )
+        with _config_manager_lock:
+            if _config_manager is None:
+                if database_path is None:
+                    raise ValueError("Database path required for first initialization")
+                _config_manager = EnhancedConfigurationManager(
+                    database_path, 
+                    environment or os.getenv('ZENITH_ENV', 'development')
+                )
     
     return _config_manager
 
@@ -1019,16 +1708,19 @@ def initialize_configuration_management(database_path: str, environment: str = N
     global _config_manager
     
     env = environment or os.getenv('ZENITH_ENV', 'development')
-    _config_manager = EnhancedConfigurationManager(database_path, env)
+    with _config_manager_lock:
+        _config_manager = EnhancedConfigurationManager(database_path, env)
     logger.info(f"Configuration management system initialized (env: {env})")
 
 
 # Convenience functions
 def get_config(key: str, default: Any = None) -> Any:
     """Get configuration value using global manager"""
-    return get_config_manager().get_config(key, default)
+    # Read the global directly; only fall back to the factory before first init.
+    # Not memoized further so initialize_configuration_management can swap it.
+    return (_config_manager or get_config_manager()).get_config(key, default)
 
 
 def set_config(key: str, value: Any) -> bool:
     """Set configuration value using global manager"""
-    return get_config_manager().set_config(key, value)
\ No newline at end of file
+    return (_config_manager or get_config_manager()).set_config(key, value)
\ No newline at end of file
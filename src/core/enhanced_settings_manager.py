@@ -29,9 +29,13 @@ See Also:
 """
 
 from typing import Dict, Any, Optional, List, Tuple, Callable
+import atexit
 import json
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import replace
 from datetime import datetime
 import threading
+import time
 
 from .qdrant_manager import get_qdrant_client
 from .config import config
@@ -41,6 +45,62 @@ from qdrant_client.http import models
 
 logger = get_logger(__name__)
 
+_SETTINGS_VECTOR_SIZE = 384
+
+# How long a provider health result is reused by get_provider_status
+PROVIDER_HEALTH_TTL_SECONDS = 30.0
+
+# Settings whose change requires provider reinitialization
+_OLLAMA_KEYS = frozenset({'ollama_enabled', 'ollama_endpoint', 'ollama_chat_model', 'ollama_embedding_model'})
+_OPENAI_KEYS = frozenset({'openai_api_key', 'openai_chat_model', 'openai_embedding_model'})
+_PROVIDER_KEYS = _OLLAMA_KEYS | _OPENAI_KEYS | {'preferred_chat_provider', 'preferred_embedding_provider'}
+
+# Validation tables for _validate_settings_update
+_VALID_PROVIDERS = frozenset({"openai", "ollama"})
+_VALID_QDRANT_MODES = frozenset({"local", "cloud"})
+_SQLITE_BOOLEAN_FIELDS = ("sqlite_auto_backup", "sqlite_auto_vacuum", "sqlite_wal_mode")
+_NUMERIC_FIELDS = {
+    "chunk_size": (100, 4000),
+    "chunk_overlap": (0, 1000),
+    "max_chunks_per_query": (1, 50),
+    "max_file_size_mb": (1, 500),
+    "session_duration_hours": (1, 168),
+    "max_users": (1, 10000)
+}
+_BOOLEAN_FIELDS = (
+    "ollama_enabled", "minio_enabled", "allow_user_registration",
+    "require_admin_approval", "minio_secure"
+)
+
+# Fields an update may change directly (updated_at is always set by the manager)
+_SETTINGS_FIELDS = frozenset(SystemSettings.__dataclass_fields__)
+_UPDATABLE_FIELDS = _SETTINGS_FIELDS - {'updated_at'}
+
+# Payload keys fetched when loading settings: SystemSettings fields, the point type
+# marker, and the legacy langsmith_* keys that SystemSettings.from_dict migrates
+_SETTINGS_PAYLOAD_FIELDS = sorted(_SETTINGS_FIELDS | {
+    'setting_type',
+    'langsmith_enabled', 'langsmith_api_key', 'langsmith_project_name',
+    'langsmith_endpoint', 'langsmith_tracing_enabled', 'langsmith_evaluation_enabled'
+})
+
+# How long _notify_callbacks waits for provider-change subscribers to finish
+CALLBACK_WAIT_SECONDS = 30.0
+
+# How long queued settings saves may take to drain when the process exits
+SAVE_FLUSH_AT_EXIT_SECONDS = 10.0
+
+# How long an Ollama model listing is reused across back-to-back checks
+OLLAMA_MODELS_TTL_SECONDS = 5.0
+
+# Upper bound on cached provider clients (connection tests can use ad-hoc endpoints/keys)
+_MAX_CACHED_CLIENTS = 8
+
+# The settings collection holds a single point that is only ever fetched by ID,
+# so its vector is a fixed placeholder. A unit vector (rather than all zeros)
+# keeps it valid under the collection's cosine distance.
+_SETTINGS_VECTOR: List[float] = [1.0] + [0.0] * (_SETTINGS_VECTOR_SIZE - 1)
+
 
 class ProviderInitializationError(Exception):
     """Exception raised when provider initialization fails"""
@@ -58,7 +118,8 @@ class EnhancedSettingsManager:
         self.collection_name = "zenith_settings"
         self.settings_id = 1
         
-        # Thread lock for settings operations
+        # Serializes settings writers. Readers never lock: _current_settings is an
+        # immutable snapshot that writers replace with a single attribute assignment.
         self._lock = threading.Lock()
         
         # Provider state tracking
@@ -69,17 +130,76 @@ class EnhancedSettingsManager:
             'last_embedding_provider': None
         }
         
-        # Callbacks for when providers change
-        self._provider_change_callbacks: List[Callable[[str, Dict[str, Any]], None]] = []
+        # Provider health results keyed by (provider, config) -> (checked_at, result)
+        self._health_cache: Dict[Tuple, Tuple[float, Tuple[bool, str]]] = {}
+        self._health_cache_lock = threading.Lock()
         
-        # Ensure settings collection exists
-        self._ensure_settings_collection()
+        # Provider clients reused across checks so their connection pools stay warm
+        self._ollama_clients: Dict[str, Any] = {}
+        self._openai_clients: Dict[str, Any] = {}
+        self._clients_lock = threading.Lock()
+        # Ollama model names keyed by endpoint -> (listed_at, names)
+        self._ollama_models_cache: Dict[str, Tuple[float, List[str]]] = {}
         
-        # Load current settings
-        self._current_settings = self._load_settings()
+        # Callbacks for when providers change
+        self._provider_change_callbacks: List[Callable[[str, Dict[str, Any]], None]] = []
+        self._notify_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="settings-notify")
+        
+        # Background writer for settings saves; only the newest pending snapshot is kept
+        self._save_cond = threading.Condition()
+        self._pending_save: Optional[SystemSettings] = None
+        self._save_in_flight = False
+        self._last_save_ok = True
+        self._save_thread: Optional[threading.Thread] = None
+        
+        # The settings collection is created and the settings are loaded on first
+        # access, so constructing the manager does not block on Qdrant
+        self._settings_snapshot: Optional[SystemSettings] = None
+        # (snapshot, stored payload) for the most recently serialized snapshot
+        self._settings_payload_cache: Tuple[Optional[SystemSettings], Dict[str, Any]] = (None, {})
+        self._collection_ready = False
+        # Once the settings point exists, saves only rewrite its payload
+        self._settings_point_exists = False
+        self._init_lock = threading.Lock()
+    
+    @property
+    def _current_settings(self) -> SystemSettings:
+        """Current settings snapshot, loaded from Qdrant on first access"""
+        settings = self._settings_snapshot
+        if settings is None:
+            settings = self._ensure_loaded()
+        return settings
+    
+    @_current_settings.setter
+    def _current_settings(self, settings: SystemSettings):
+        self._settings_snapshot = settings
+    
+    def _settings_payload(self, settings: SystemSettings) -> Dict[str, Any]:
+        """
+        Memoized Qdrant payload (settings.to_dict() plus the setting_type marker)
+        for an immutable snapshot
         
-        # Initialize provider states
-        self._initialize_provider_states()
+        The payload is the canonical serialized form: it is stored as-is and
+        SystemSettings.from_dict ignores the marker on load. The returned dict is
+        shared and must not be modified; copy it first.
+        """
+        cached_settings, cached_payload = self._settings_payload_cache
+        if cached_settings is not settings:
+            cached_payload = settings.to_dict()
+            cached_payload["setting_type"] = "system"
+            self._settings_payload_cache = (settings, cached_payload)
+        return cached_payload
+    
+    def _ensure_loaded(self) -> SystemSettings:
+        """Create the settings collection and load settings exactly once"""
+        with self._init_lock:
+            if self._settings_snapshot is None:
+                if not self._collection_ready:
+                    self._ensure_settings_collection()
+                    self._collection_ready = True
+                self._settings_snapshot = self._load_settings()
+                self._initialize_provider_states()
+            return self._settings_snapshot
     
     def register_provider_change_callback(self, callback: Callable[[str, Dict[str, Any]], None]):
         """
@@ -97,7 +217,7 @@ class EnhancedSettingsManager:
                 # Create collection with minimal vector size for settings
                 success = self.qdrant_manager.create_collection(
                     self.collection_name,
-                    vector_size=384,
+                    vector_size=_SETTINGS_VECTOR_SIZE,
                     distance=models.Distance.COSINE
                 )
                 
@@ -113,22 +233,6 @@ class EnhancedSettingsManager:
         except Exception as e:
             logger.error(f"Error ensuring settings collection: {e}")
     
-    def _create_settings_vector(self, settings_id: int) -> List[float]:
-        """Create a simple vector for settings storage"""
-        import hashlib
-        
-        # Create a deterministic vector based on settings ID
-        hash_obj = hashlib.sha256(str(settings_id).encode())
-        hash_bytes = hash_obj.digest()
-        
-        # Convert to 384-dimensional vector
-        vector = []
-        for i in range(384):
-            byte_index = i % len(hash_bytes)
-            vector.append((hash_bytes[byte_index] - 128) / 128.0)
-        
-        return vector
-    
     def _load_settings(self) -> SystemSettings:
         """Load settings from Qdrant with .env fallback and proper provider priority"""
         try:
@@ -136,22 +240,22 @@ class EnhancedSettingsManager:
             points = self.qdrant_manager.get_points(
                 self.collection_name,
                 [self.settings_id],
-                with_vectors=False
+                with_vectors=False,
+                with_payload=models.PayloadSelectorInclude(include=_SETTINGS_PAYLOAD_FIELDS)
             )
             
             if points and len(points) > 0:
+                self._settings_point_exists = True
                 settings_data = points[0].payload
                 if settings_data.get("setting_type") == "system":
-                    # Remove metadata
-                    clean_data = {k: v for k, v in settings_data.items() 
-                                if k not in ["setting_type", "vector"]}
-                    settings = SystemSettings.from_dict(clean_data)
+                    # from_dict ignores the setting_type marker, so no cleanup pass is needed
+                    settings = SystemSettings.from_dict(settings_data)
                     
                     # FORCE APPLY ENV OVERRIDES - this ensures .env settings are respected
                     settings = self._apply_env_overrides(settings)
                     
-                    # Force save the updated settings back to database
-                    self._save_settings(settings)
+                    # Force save the updated settings back to database (in the background)
+                    self._persist_settings(settings, wait=False)
                     logger.info(f"Updated existing settings - Ollama enabled: {settings.ollama_enabled}, "
                                f"Chat provider: {settings.get_effective_chat_provider()}, "
                                f"Embedding provider: {settings.get_effective_embedding_provider()}")
@@ -160,7 +264,7 @@ class EnhancedSettingsManager:
             # Create default settings if none exist
             logger.info("Creating default system settings from .env configuration")
             default_settings = self._create_default_settings_from_env()
-            self._save_settings(default_settings)
+            self._persist_settings(default_settings, wait=False)
             return default_settings
             
         except Exception as e:
@@ -171,35 +275,37 @@ class EnhancedSettingsManager:
         """Create default settings from environment configuration"""
         from src.core.config import config
         
-        settings = SystemSettings()
-        
-        # Load from environment
-        settings.openai_api_key = config.openai_api_key
-        settings.openai_chat_model = config.openai_model
-        settings.openai_embedding_model = config.openai_embedding_model
-        
-        settings.ollama_enabled = config.ollama_enabled
-        settings.ollama_endpoint = config.ollama_base_url
-        settings.ollama_chat_model = config.ollama_chat_model
-        settings.ollama_embedding_model = config.ollama_embedding_model
-        
         # Provider selection with priority logic
         if config.ollama_enabled:
             # If Ollama is enabled in .env, it should be the default
-            settings.preferred_chat_provider = "ollama"
-            settings.preferred_embedding_provider = "ollama"
+            chat_provider = embedding_provider = "ollama"
         else:
-            settings.preferred_chat_provider = config.chat_provider
-            settings.preferred_embedding_provider = config.embedding_provider
-        
-        # Langfuse configuration
-        settings.langfuse_enabled = config.langfuse_enabled
-        settings.langfuse_public_key = config.langfuse_public_key
-        settings.langfuse_secret_key = config.langfuse_secret_key
-        settings.langfuse_host = config.langfuse_host
-        settings.langfuse_project_name = config.langfuse_project_name
-        settings.langfuse_tracing_enabled = config.langfuse_tracing_enabled
-        settings.langfuse_evaluation_enabled = config.langfuse_evaluation_enabled
+            chat_provider = config.chat_provider
+            embedding_provider = config.embedding_provider
+        
+        settings = SystemSettings(
+            # Load from environment
+            openai_api_key=config.openai_api_key,
+            openai_chat_model=config.openai_model,
+            openai_embedding_model=config.openai_embedding_model,
+            
+            ollama_enabled=config.ollama_enabled,
+            ollama_endpoint=config.ollama_base_url,
+            ollama_chat_model=config.ollama_chat_model,
+            ollama_embedding_model=config.ollama_embedding_model,
+            
+            preferred_chat_provider=chat_provider,
+            preferred_embedding_provider=embedding_provider,
+            
+            # Langfuse configuration
+            langfuse_enabled=config.langfuse_enabled,
+            langfuse_public_key=config.langfuse_public_key,
+            langfuse_secret_key=config.langfuse_secret_key,
+            langfuse_host=config.langfuse_host,
+            langfuse_project_name=config.langfuse_project_name,
+            langfuse_tracing_enabled=config.langfuse_tracing_enabled,
+            langfuse_evaluation_enabled=config.langfuse_evaluation_enabled
+        )
         
         logger.info(f"Created default settings - Ollama enabled: {settings.ollama_enabled}, "
                    f"Chat provider: {settings.get_effective_chat_provider()}, "
@@ -211,36 +317,39 @@ class EnhancedSettingsManager:
         """Apply environment overrides to existing settings"""
         from src.core.config import config
         
+        overrides = {}
+        
         # Update API keys and endpoints from environment if not set in admin
         if not settings.openai_api_key and config.openai_api_key:
-            settings.openai_api_key = config.openai_api_key
+            overrides["openai_api_key"] = config.openai_api_key
         
         if not settings.langfuse_public_key and config.langfuse_public_key:
-            settings.langfuse_public_key = config.langfuse_public_key
+            overrides["langfuse_public_key"] = config.langfuse_public_key
         
         if not settings.langfuse_secret_key and config.langfuse_secret_key:
-            settings.langfuse_secret_key = config.langfuse_secret_key
+            overrides["langfuse_secret_key"] = config.langfuse_secret_key
         
         # CRITICAL: Apply .env overrides - .env always takes precedence
         # Override Ollama enabled status from .env
-        settings.ollama_enabled = config.ollama_enabled
+        overrides["ollama_enabled"] = config.ollama_enabled
         logger.info(f"Applied .env Ollama enabled override: {config.ollama_enabled}")
         
         # Apply provider selection from .env if specified
         if hasattr(config, 'chat_provider') and config.chat_provider:
-            settings.preferred_chat_provider = config.chat_provider
+            overrides["preferred_chat_provider"] = config.chat_provider
             logger.info(f"Applied .env chat provider override: {config.chat_provider}")
         
         if hasattr(config, 'embedding_provider') and config.embedding_provider:
-            settings.preferred_embedding_provider = config.embedding_provider
+            overrides["preferred_embedding_provider"] = config.embedding_provider
             logger.info(f"Applied .env embedding provider override: {config.embedding_provider}")
         
         # Apply Langsmith enabled override from .env if admin hasn't explicitly enabled it
         if config.langfuse_enabled and not settings.langfuse_enabled:
-            settings.langfuse_enabled = True
+            overrides["langfuse_enabled"] = True
             logger.info("Langsmith enabled via .env configuration")
         
-        return settings
+        # Settings snapshots are immutable, so the overrides produce a new one
+        return replace(settings, **overrides)
     
     def get_effective_chat_provider(self, settings: SystemSettings = None) -> str:
         """Get effective chat provider respecting explicit provider selection"""
@@ -325,11 +434,12 @@ class EnhancedSettingsManager:
             # Create fresh settings from .env
             fresh_settings = self._create_default_settings_from_env()
             
-            # Save to database
-            self._save_settings(fresh_settings)
-            
-            # Update current settings
-            self._current_settings = fresh_settings
+            with self._lock:
+                # Save to database
+                self._persist_settings(fresh_settings)
+                
+                # Update current settings
+                self._current_settings = fresh_settings
             
             logger.info(f"Settings reset complete - Ollama enabled: {fresh_settings.ollama_enabled}, "
                        f"Chat provider: {fresh_settings.get_effective_chat_provider()}, "
@@ -341,29 +451,97 @@ class EnhancedSettingsManager:
             logger.error(f"Error resetting settings: {e}")
             return False
     
+    def _persist_settings(self, settings: SystemSettings, wait: bool = True) -> bool:
+        """
+        Queue settings for saving on the background writer
+        
+        Consecutive queued saves are coalesced so only the newest snapshot is written,
+        and all writes go through one thread so they reach Qdrant in order.
+        
+        Args:
+            settings: Settings snapshot to save
+            wait: Block until the save completes and report its outcome
+            
+        Returns:
+            True if queued (wait=False) or saved successfully (wait=True)
+        """
+        with self._save_cond:
+            self._pending_save = settings
+            if self._save_thread is None or not self._save_thread.is_alive():
+                if self._save_thread is None:
+                    # The writer is a daemon thread; drain it before the interpreter exits
+                    atexit.register(self._flush_at_exit)
+                self._save_thread = threading.Thread(
+                    target=self._save_worker, name="settings-save", daemon=True
+                )
+                self._save_thread.start()
+            self._save_cond.notify_all()
+        
+        return self.flush() if wait else True
+    
+    def _save_worker(self):
+        """Drain queued settings saves"""
+        while True:
+            with self._save_cond:
+                while self._pending_save is None:
+                    self._save_cond.wait()
+                settings, self._pending_save = self._pending_save, None
+                self._save_in_flight = True
+            
+            success = self._save_settings(settings)
+            
+            with self._save_cond:
+                self._save_in_flight = False
+                self._last_save_ok = success
+                self._save_cond.notify_all()
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for queued settings saves to reach Qdrant
+        
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+            
+        Returns:
+            True if the queue drained and the last save succeeded
+        """
+        with self._save_cond:
+            drained = self._save_cond.wait_for(
+                lambda: self._pending_save is None and not self._save_in_flight, timeout
+            )
+            return drained and self._last_save_ok
+    
+    def _flush_at_exit(self):
+        """Write whatever settings saves are still queued when the process exits"""
+        if not self.flush(timeout=SAVE_FLUSH_AT_EXIT_SECONDS):
+            logger.warning("Settings saves still pending or failed at exit; latest changes may be lost")
+    
     def _save_settings(self, settings: SystemSettings) -> bool:
         """Save settings to Qdrant"""
         try:
-            # Create vector for storage
-            vector = self._create_settings_vector(self.settings_id)
-            
             # Prepare payload
-            payload = settings.to_dict()
-            payload["setting_type"] = "system"
-            
-            # Create point
-            point = models.PointStruct(
-                id=self.settings_id,
-                vector=vector,
-                payload=payload
-            )
+            payload = self._settings_payload(settings)
             
-            # Upsert to Qdrant
-            success = self.qdrant_manager.upsert_points(
+            # The vector never changes, so an existing point only needs its payload replaced
+            success = self._settings_point_exists and self.qdrant_manager.overwrite_payload(
                 self.collection_name,
-                [point]
+                payload,
+                [self.settings_id]
             )
             
+            if not success:
+                # First save (or the point went missing): create the full point
+                point = models.PointStruct(
+                    id=self.settings_id,
+                    vector=_SETTINGS_VECTOR,
+                    payload=payload
+                )
+                success = self.qdrant_manager.upsert_points(
+                    self.collection_name,
+                    [point]
+                )
+                self._settings_point_exists = success
+            
             if success:
                 logger.info("System settings saved successfully")
                 return True
@@ -388,37 +566,52 @@ class EnhancedSettingsManager:
         })
     
     def get_settings(self) -> SystemSettings:
-        """Get current system settings"""
-        with self._lock:
-            return self._current_settings
+        """
+        Get current system settings
+        
+        The returned object is a shared, frozen snapshot; use update_settings()
+        to change settings.
+        """
+        return self._current_settings
     
-    def update_settings(self, updates: Dict[str, Any]) -> Tuple[bool, str]:
+    def update_settings(self, updates: Dict[str, Any], durable: bool = True) -> Tuple[bool, str]:
         """
         Update system settings with dynamic reinitialization
         
         Args:
             updates: Dictionary of setting updates
+            durable: Wait for the save to reach Qdrant; when False the save is queued
+                and flush() can be used to confirm it later
             
         Returns:
             Tuple of (success, message)
         """
-        with self._lock:
-            try:
-                # Validate updates
-                validation_error = self._validate_settings_update(updates)
-                if validation_error:
-                    return False, validation_error
-                
+        try:
+            # Validate updates (only inspects the update values, so no lock is needed)
+            validation_error = self._validate_settings_update(updates)
+            if validation_error:
+                return False, validation_error
+            
+            # Only the read-modify-write of the settings snapshot is serialized
+            with self._lock:
                 # Store previous settings for comparison
-                old_settings = self._current_settings.to_dict()
+                old_settings = self._settings_payload(self._current_settings)
                 
-                # Apply updates to current settings
-                settings_dict = self._current_settings.to_dict()
-                settings_dict.update(updates)
-                settings_dict["updated_at"] = datetime.now()
+                # Skip validation, provider checks and the Qdrant write when nothing changes;
+                # keys that are not settings fields would be dropped on save anyway
+                effective_updates = {k: v for k, v in updates.items()
+                                     if k in _UPDATABLE_FIELDS and old_settings.get(k) != v}
+                if not effective_updates:
+                    return True, "No changes"
                 
-                # Create new settings object
-                new_settings = SystemSettings.from_dict(settings_dict)
+                # Build the new snapshot and its payload side by side instead of
+                # round-tripping through from_dict()/to_dict()
+                updated_at = datetime.now()
+                new_settings = replace(self._current_settings, updated_at=updated_at, **effective_updates)
+                settings_dict = dict(old_settings)
+                settings_dict.update(effective_updates)
+                settings_dict["updated_at"] = updated_at.isoformat()
+                self._settings_payload_cache = (new_settings, settings_dict)
                 
                 # Check what changed and needs reinitialization
                 provider_changes = self._detect_provider_changes(old_settings, settings_dict)
@@ -430,25 +623,45 @@ class EnhancedSettingsManager:
                     return quick_validation_result
                 
                 # Save to Qdrant
-                if self._save_settings(new_settings):
-                    self._current_settings = new_settings
-                    
-                    # Apply provider changes dynamically (without heavy validation)
-                    self._apply_provider_changes(provider_changes, new_settings)
-                    
-                    # Update global config for backward compatibility
-                    self._update_global_config(new_settings)
-                    
-                    logger.info(f"Settings updated with provider changes: {list(updates.keys())}")
-                    return True, "Settings updated successfully. Use 'Force Reinitialize' to test providers."
-                else:
+                if not self._persist_settings(new_settings, wait=durable):
                     return False, "Failed to save settings"
-                    
-            except Exception as e:
-                logger.error(f"Error updating settings: {e}")
-                return False, f"Update failed: {str(e)}"
+                
+                self._current_settings = new_settings
+                
+                # Update global config for backward compatibility
+                self._update_global_config(new_settings)
+            
+            # Apply provider changes dynamically (without heavy validation); callbacks
+            # run outside the lock so slow subscribers do not block other updates
+            self._apply_provider_changes(provider_changes, new_settings)
+            
+            logger.info(f"Settings updated with provider changes: {list(effective_updates.keys())}")
+            return True, "Settings updated successfully. Use 'Force Reinitialize' to test providers."
+            
+        except Exception as e:
+            logger.error(f"Error updating settings: {e}")
+            return False, f"Update failed: {str(e)}"
+    
+    def update_settings_batch(self, updates_list: List[Dict[str, Any]], durable: bool = True) -> Tuple[bool, str]:
+        """
+        Apply several settings updates as a single update
+        
+        The update dicts are merged in order (later keys override earlier ones), so
+        validation, provider change detection and the Qdrant write run once.
+        
+        Args:
+            updates_list: Setting update dictionaries to merge
+            durable: Wait for the save to reach Qdrant (see update_settings)
+            
+        Returns:
+            Tuple of (success, message)
+        """
+        merged: Dict[str, Any] = {}
+        for updates in updates_list:
+            merged.update(updates)
+        return self.update_settings(merged, durable=durable)
     
-    def quick_update_settings(self, updates: Dict[str, Any]) -> Tuple[bool, str]:
+    def quick_update_settings(self, updates: Dict[str, Any], durable: bool = True) -> Tuple[bool, str]:
         """
         Quick settings update that bypasses all validation and provider testing
         Use this when the normal update_settings() method hangs
@@ -458,7 +671,7 @@ class EnhancedSettingsManager:
                 logger.info(f"Quick settings update: {list(updates.keys())}")
                 
                 # Apply updates directly without validation
-                settings_dict = self._current_settings.to_dict()
+                settings_dict = dict(self._settings_payload(self._current_settings))
                 settings_dict.update(updates)
                 settings_dict["updated_at"] = datetime.now()
                 
@@ -466,7 +679,7 @@ class EnhancedSettingsManager:
                 new_settings = SystemSettings.from_dict(settings_dict)
                 
                 # Save directly without validation
-                if self._save_settings(new_settings):
+                if self._persist_settings(new_settings, wait=durable):
                     self._current_settings = new_settings
                     logger.info("Quick settings update completed - use 'Force Reinitialize' to test providers")
                     return True, "Settings saved successfully (validation skipped)"
@@ -479,42 +692,15 @@ class EnhancedSettingsManager:
     
     def _detect_provider_changes(self, old_settings: Dict[str, Any], new_settings: Dict[str, Any]) -> Dict[str, bool]:
         """Detect which providers need reinitialization"""
-        changes = {
-            'chat_provider_changed': False,
-            'embedding_provider_changed': False,
-            'ollama_settings_changed': False,
-            'openai_settings_changed': False,
-            'ollama_enabled_changed': False
-        }
+        changed = {k for k in _PROVIDER_KEYS if old_settings.get(k) != new_settings.get(k)}
         
-        # Check for provider switches
-        if old_settings.get('preferred_chat_provider') != new_settings.get('preferred_chat_provider'):
-            changes['chat_provider_changed'] = True
-        
-        if old_settings.get('preferred_embedding_provider') != new_settings.get('preferred_embedding_provider'):
-            changes['embedding_provider_changed'] = True
-        
-        # Check for Ollama configuration changes
-        ollama_settings = [
-            'ollama_enabled', 'ollama_endpoint', 'ollama_chat_model', 'ollama_embedding_model'
-        ]
-        for setting in ollama_settings:
-            if old_settings.get(setting) != new_settings.get(setting):
-                changes['ollama_settings_changed'] = True
-                if setting == 'ollama_enabled':
-                    changes['ollama_enabled_changed'] = True
-                break
-        
-        # Check for OpenAI configuration changes
-        openai_settings = [
-            'openai_api_key', 'openai_chat_model', 'openai_embedding_model'
-        ]
-        for setting in openai_settings:
-            if old_settings.get(setting) != new_settings.get(setting):
-                changes['openai_settings_changed'] = True
-                break
-        
-        return changes
+        return {
+            'chat_provider_changed': 'preferred_chat_provider' in changed,
+            'embedding_provider_changed': 'preferred_embedding_provider' in changed,
+            'ollama_settings_changed': bool(changed & _OLLAMA_KEYS),
+            'openai_settings_changed': bool(changed & _OPENAI_KEYS),
+            'ollama_enabled_changed': 'ollama_enabled' in changed
+        }
     
     def _validate_provider_configurations(self, new_settings: SystemSettings, changes: Dict[str, bool]) -> Tuple[bool, str]:
         """Validate new provider configurations before applying"""
@@ -601,20 +787,15 @@ class EnhancedSettingsManager:
     def check_ollama_models_availability(self, settings: SystemSettings) -> Tuple[bool, str, Dict[str, bool]]:
         """Quick check if Ollama models are available without attempting to pull them"""
         try:
-            from .ollama_integration import OllamaClient
-            
-            client = OllamaClient(settings.ollama_endpoint)
-            if not client.health_check():
+            model_names = self._list_ollama_models(settings.ollama_endpoint)
+            if model_names is None:
                 return False, f"Cannot connect to Ollama at {settings.ollama_endpoint}", {}
-            
-            # Get available models
-            available_models = client.list_models()
-            model_names = [model.name for model in available_models]
+            available = set(model_names)
             
             # Check model availability
             models_status = {
-                'chat_model': settings.ollama_chat_model in model_names,
-                'embedding_model': settings.ollama_embedding_model in model_names
+                'chat_model': settings.ollama_chat_model in available,
+                'embedding_model': settings.ollama_embedding_model in available
             }
             
             all_available = all(models_status.values())
@@ -631,23 +812,80 @@ class EnhancedSettingsManager:
         except Exception as e:
             return False, f"Ollama check failed: {str(e)}", {}
 
+    def _get_ollama_client(self, endpoint: str):
+        """Get a cached Ollama client for an endpoint"""
+        from .ollama_integration import OllamaClient
+        
+        with self._clients_lock:
+            client = self._ollama_clients.get(endpoint)
+            if client is None:
+                if len(self._ollama_clients) >= _MAX_CACHED_CLIENTS:
+                    self._ollama_clients.clear()
+                client = self._ollama_clients[endpoint] = OllamaClient(endpoint)
+            return client
+    
+    def _get_openai_client(self, api_key: str):
+        """Get a cached OpenAI client for an API key"""
+        import openai
+        
+        with self._clients_lock:
+            client = self._openai_clients.get(api_key)
+            if client is None:
+                if len(self._openai_clients) >= _MAX_CACHED_CLIENTS:
+                    self._openai_clients.clear()
+                client = self._openai_clients[api_key] = openai.OpenAI(api_key=api_key)
+            return client
+    
+    def _list_ollama_models(self, endpoint: str) -> Optional[List[str]]:
+        """
+        List model names on an Ollama endpoint, reusing a very recent listing
+        
+        Returns:
+            Model names, or None if the endpoint is unreachable
+        """
+        with self._clients_lock:
+            cached = self._ollama_models_cache.get(endpoint)
+        if cached is not None and time.monotonic() - cached[0] < OLLAMA_MODELS_TTL_SECONDS:
+            return cached[1]
+        
+        client = self._get_ollama_client(endpoint)
+        if not client.health_check():
+            return None
+        model_names = [model.name for model in client.list_models()]
+        
+        with self._clients_lock:
+            self._ollama_models_cache[endpoint] = (time.monotonic(), model_names)
+        return model_names
+    
+    def _invalidate_ollama_models(self, endpoint: str):
+        """Forget the cached model listing for an endpoint"""
+        with self._clients_lock:
+            self._ollama_models_cache.pop(endpoint, None)
+    
+    def _evict_provider_clients(self, changes: Dict[str, bool]):
+        """Drop cached clients for providers whose configuration changed"""
+        with self._clients_lock:
+            if changes.get('ollama_settings_changed'):
+                self._ollama_clients.clear()
+                self._ollama_models_cache.clear()
+            if changes.get('openai_settings_changed'):
+                self._openai_clients.clear()
+    
     def _test_ollama_configuration(self, settings: SystemSettings, skip_model_pull: bool = False) -> Tuple[bool, str]:
         """Test Ollama configuration"""
         try:
-            from .ollama_integration import OllamaClient
-            
-            client = OllamaClient(settings.ollama_endpoint)
-            if not client.health_check():
-                return False, f"Cannot connect to Ollama at {settings.ollama_endpoint}"
+            client = self._get_ollama_client(settings.ollama_endpoint)
             
             # Check if required models exist
-            available_models = client.list_models()
-            model_names = [model.name for model in available_models]
+            model_names = self._list_ollama_models(settings.ollama_endpoint)
+            if model_names is None:
+                return False, f"Cannot connect to Ollama at {settings.ollama_endpoint}"
+            available = set(model_names)
             
             logger.info(f"Available Ollama models: {model_names}")
             
             # Check chat model
-            if settings.ollama_chat_model in model_names:
+            if settings.ollama_chat_model in available:
                 logger.info(f"Chat model '{settings.ollama_chat_model}' is already available")
             else:
                 if skip_model_pull:
@@ -656,11 +894,12 @@ class EnhancedSettingsManager:
                 else:
                     # Try to pull the model
                     logger.info(f"Attempting to pull missing chat model: {settings.ollama_chat_model}")
+                    self._invalidate_ollama_models(settings.ollama_endpoint)
                     if not client.pull_model(settings.ollama_chat_model):
                         return False, f"Chat model '{settings.ollama_chat_model}' not available and could not be pulled"
             
             # Check embedding model
-            if settings.ollama_embedding_model in model_names:
+            if settings.ollama_embedding_model in available:
                 logger.info(f"Embedding model '{settings.ollama_embedding_model}' is already available")
             else:
                 if skip_model_pull:
@@ -668,6 +907,7 @@ class EnhancedSettingsManager:
                     return False, f"Embedding model '{settings.ollama_embedding_model}' not available"
                 else:
                     logger.info(f"Attempting to pull missing embedding model: {settings.ollama_embedding_model}")
+                    self._invalidate_ollama_models(settings.ollama_endpoint)
                     if not client.pull_model(settings.ollama_embedding_model):
                         return False, f"Embedding model '{settings.ollama_embedding_model}' not available and could not be pulled"
             
@@ -679,10 +919,7 @@ class EnhancedSettingsManager:
     def _test_openai_configuration(self, settings: SystemSettings) -> Tuple[bool, str]:
         """Test OpenAI configuration"""
         try:
-            import openai
-            
-            # Create temporary client
-            client = openai.OpenAI(api_key=settings.openai_api_key)
+            client = self._get_openai_client(settings.openai_api_key)
             
             # Test with a simple API call
             response = client.models.list()
@@ -731,6 +968,10 @@ class EnhancedSettingsManager:
                 'embedding_model': new_settings.openai_embedding_model
             })
         
+        if changes['ollama_settings_changed'] or changes['openai_settings_changed']:
+            self._invalidate_health_cache()
+            self._evict_provider_clients(changes)
+        
         # Update provider states
         self._provider_states.update({
             'last_chat_provider': new_settings.preferred_chat_provider,
@@ -760,11 +1001,27 @@ class EnhancedSettingsManager:
     
     def _notify_callbacks(self, change_type: str, data: Dict[str, Any]):
         """Notify registered callbacks about provider changes"""
-        for callback in self._provider_change_callbacks:
-            try:
-                callback(change_type, data)
-            except Exception as e:
-                logger.error(f"Error in provider change callback: {e}")
+        callbacks = list(self._provider_change_callbacks)
+        if len(callbacks) == 1:
+            self._run_callback(callbacks[0], change_type, data)
+            return
+        
+        # Independent subscribers run concurrently; wait so callers still observe
+        # reinitialized providers when this returns
+        futures = [self._notify_pool.submit(self._run_callback, callback, change_type, data)
+                   for callback in callbacks]
+        _, not_done = wait(futures, timeout=CALLBACK_WAIT_SECONDS)
+        if not_done:
+            logger.warning(f"{len(not_done)} provider change callback(s) still running after "
+                           f"{CALLBACK_WAIT_SECONDS}s for '{change_type}'")
+    
+    @staticmethod
+    def _run_callback(callback: Callable[[str, Dict[str, Any]], None], change_type: str, data: Dict[str, Any]):
+        """Invoke a single provider change callback, logging its errors"""
+        try:
+            callback(change_type, data)
+        except Exception as e:
+            logger.error(f"Error in provider change callback: {e}")
     
     def _update_global_config(self, settings: SystemSettings):
         """Update global config object for backward compatibility"""
@@ -793,16 +1050,16 @@ class EnhancedSettingsManager:
         
         # Validate model providers
         if "preferred_chat_provider" in updates:
-            if updates["preferred_chat_provider"] not in ["openai", "ollama"]:
+            if updates["preferred_chat_provider"] not in _VALID_PROVIDERS:
                 return "Invalid chat provider. Must be 'openai' or 'ollama'"
         
         if "preferred_embedding_provider" in updates:
-            if updates["preferred_embedding_provider"] not in ["openai", "ollama"]:
+            if updates["preferred_embedding_provider"] not in _VALID_PROVIDERS:
                 return "Invalid embedding provider. Must be 'openai' or 'ollama'"
         
         # Validate Qdrant mode
         if "qdrant_mode" in updates:
-            if updates["qdrant_mode"] not in ["local", "cloud"]:
+            if updates["qdrant_mode"] not in _VALID_QDRANT_MODES:
                 return "Invalid Qdrant mode. Must be 'local' or 'cloud'"
         
         # Validate database settings (SECURITY ENHANCEMENT)
@@ -835,26 +1092,13 @@ class EnhancedSettingsManager:
                 return "Backup retention days must be a valid number"
         
         # Validate boolean SQLite settings
-        sqlite_boolean_fields = [
-            "sqlite_auto_backup", "sqlite_auto_vacuum", "sqlite_wal_mode"
-        ]
-        
-        for field in sqlite_boolean_fields:
+        for field in _SQLITE_BOOLEAN_FIELDS:
             if field in updates:
                 if not isinstance(updates[field], bool):
                     return f"{field} must be true or false"
         
         # Validate numeric values
-        numeric_fields = {
-            "chunk_size": (100, 4000),
-            "chunk_overlap": (0, 1000),
-            "max_chunks_per_query": (1, 50),
-            "max_file_size_mb": (1, 500),
-            "session_duration_hours": (1, 168),
-            "max_users": (1, 10000)
-        }
-        
-        for field, (min_val, max_val) in numeric_fields.items():
+        for field, (min_val, max_val) in _NUMERIC_FIELDS.items():
             if field in updates:
                 try:
                     value = int(updates[field])
@@ -864,12 +1108,7 @@ class EnhancedSettingsManager:
                     return f"{field} must be a valid number"
         
         # Validate boolean fields
-        boolean_fields = [
-            "ollama_enabled", "minio_enabled", "allow_user_registration",
-            "require_admin_approval", "minio_secure"
-        ]
-        
-        for field in boolean_fields:
+        for field in _BOOLEAN_FIELDS:
             if field in updates:
                 if not isinstance(updates[field], bool):
                     return f"{field} must be true or false"
@@ -880,6 +1119,7 @@ class EnhancedSettingsManager:
         """Force reinitialization of all providers"""
         try:
             logger.info("Starting force reinitialization of providers")
+            self._invalidate_health_cache()
             settings = self._current_settings
             
             # Force reinitialize only the preferred providers
@@ -952,22 +1192,61 @@ class EnhancedSettingsManager:
             logger.error(f"Error during force reinitialization: {e}")
             return False, f"Reinitialization failed: {str(e)}"
     
+    def _cached_health_check(self, cache_key: Tuple, check: Callable[[], Tuple[bool, str]]) -> Tuple[bool, str]:
+        """Run a provider health check, reusing a recent result for the same configuration"""
+        now = time.monotonic()
+        with self._health_cache_lock:
+            cached = self._health_cache.get(cache_key)
+        if cached is not None and now - cached[0] < PROVIDER_HEALTH_TTL_SECONDS:
+            return cached[1]
+        
+        result = check()
+        with self._health_cache_lock:
+            self._health_cache[cache_key] = (time.monotonic(), result)
+        return result
+    
+    def _invalidate_health_cache(self):
+        """Drop cached provider health results"""
+        with self._health_cache_lock:
+            self._health_cache.clear()
+    
     def get_provider_status(self) -> Dict[str, Any]:
         """Get current provider status and health"""
+        settings = self._current_settings
         status = {
             'current_providers': {
-                'chat': self.get_effective_chat_provider(),
-                'embedding': self.get_effective_embedding_provider()
+                'chat': self.get_effective_chat_provider(settings),
+                'embedding': self.get_effective_embedding_provider(settings)
             },
             'provider_health': {},
-            'last_updated': self._current_settings.updated_at.isoformat() if self._current_settings.updated_at else None,
-            'ollama_enabled': self.is_ollama_enabled_effective(),
-            'langfuse_enabled': self._current_settings.is_langfuse_enabled()
+            'last_updated': settings.updated_at.isoformat() if settings.updated_at else None,
+            'ollama_enabled': self.is_ollama_enabled_effective(settings),
+            'langfuse_enabled': settings.is_langfuse_enabled()
         }
         
+        # The provider checks are independent network round-trips, so run them concurrently
+        checks = {}
+        if settings.openai_api_key:
+            checks['openai'] = lambda: self._cached_health_check(
+                ('openai', settings.openai_api_key, settings.openai_chat_model, settings.openai_embedding_model),
+                lambda: self._test_openai_configuration(settings)
+            )
+        if self.is_ollama_enabled_effective(settings):
+            checks['ollama'] = lambda: self._cached_health_check(
+                ('ollama', settings.ollama_endpoint, settings.ollama_chat_model, settings.ollama_embedding_model),
+                lambda: self._test_ollama_configuration(settings, skip_model_pull=True)
+            )
+        
+        if len(checks) > 1:
+            with ThreadPoolExecutor(max_workers=len(checks), thread_name_prefix="provider-health") as executor:
+                futures = {name: executor.submit(check) for name, check in checks.items()}
+                health = {name: future.result() for name, future in futures.items()}
+        else:
+            health = {name: check() for name, check in checks.items()}
+        
         # Check OpenAI health
-        if self._current_settings.openai_api_key:
-            openai_health = self._test_openai_configuration(self._current_settings)
+        if 'openai' in health:
+            openai_health = health['openai']
             status['provider_health']['openai'] = {
                 'healthy': openai_health[0],
                 'message': openai_health[1],
@@ -981,8 +1260,8 @@ class EnhancedSettingsManager:
             }
         
         # Check Ollama health
-        if self.is_ollama_enabled_effective():
-            ollama_health = self._test_ollama_configuration(self._current_settings, skip_model_pull=True)
+        if 'ollama' in health:
+            ollama_health = health['ollama']
             status['provider_health']['ollama'] = {
                 'healthy': ollama_health[0],
                 'message': ollama_health[1],
@@ -1027,10 +1306,11 @@ class EnhancedSettingsManager:
         """Test OpenAI connection (backward compatibility)"""
         try:
             # Create temporary settings object for testing
-            test_settings = SystemSettings()
-            test_settings.openai_api_key = api_key
-            test_settings.openai_chat_model = self._current_settings.openai_chat_model
-            test_settings.openai_embedding_model = self._current_settings.openai_embedding_model
+            test_settings = SystemSettings(
+                openai_api_key=api_key,
+                openai_chat_model=self._current_settings.openai_chat_model,
+                openai_embedding_model=self._current_settings.openai_embedding_model
+            )
             
             return self._test_openai_configuration(test_settings)
         except Exception as e:
@@ -1040,10 +1320,11 @@ class EnhancedSettingsManager:
         """Test Ollama connection (backward compatibility)"""
         try:
             # Create temporary settings object for testing
-            test_settings = SystemSettings()
-            test_settings.ollama_endpoint = endpoint
-            test_settings.ollama_chat_model = self._current_settings.ollama_chat_model
-            test_settings.ollama_embedding_model = self._current_settings.ollama_embedding_model
+            test_settings = SystemSettings(
+                ollama_endpoint=endpoint,
+                ollama_chat_model=self._current_settings.ollama_chat_model,
+                ollama_embedding_model=self._current_settings.ollama_embedding_model
+            )
             
             return self._test_ollama_configuration(test_settings, skip_model_pull=False)
         except Exception as e:
@@ -4,11 +4,17 @@ Supports user isolation, multiple embedding providers, and advanced features
 """
 
 import logging
-from typing import List, Optional, Dict, Any, Union
+import hashlib
+import os
+import threading
+import time
+from array import array
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Union, Iterator
 import uuid
 
 from langchain_openai import OpenAIEmbeddings
-from langchain_qdrant import Qdrant
 from langchain_core.documents import Document
 from qdrant_client.http import models
 from qdrant_client.http.models import Distance, VectorParams
@@ -82,7 +88,17 @@ class OllamaEmbeddingProvider(EmbeddingProvider):
         self.embedding_engine = OllamaEmbeddingEngine(self.model_name)
     
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
-        return self.embedding_engine.embed_documents(texts)
+        if not texts:
+            return []
+        embeddings = self._embed_batch_native(texts)
+        if embeddings is None:
+            # Older Ollama servers only have the per-text /api/embeddings endpoint
+            embeddings = self.embedding_engine.embed_documents(texts)
+        return embeddings
+    
+    def _embed_batch_native(self, texts: List[str]) -> Optional[List[List[float]]]:
+        """Embed all texts in one /api/embed round-trip (None if unsupported)"""
+        return self.embedding_engine.client.generate_embeddings_batch(texts, self.model_name)
     
     def embed_query(self, text: str) -> List[float]:
         embedding = self.embedding_engine.embed_text(text)
@@ -105,7 +121,7 @@ class OllamaEmbeddingProvider(EmbeddingProvider):
         
         # Try to get actual dimension by testing
         try:
-            test_embedding = self.embed_text("test")
+            test_embedding = self.embed_query("test")
             actual_dimension = len(test_embedding)
             
             # If we got a dimension and it's different from our map, log it
@@ -122,16 +138,181 @@ class OllamaEmbeddingProvider(EmbeddingProvider):
             return dimensions.get(self.model_name, 384)
 
 
+# Payload indexes every document collection needs for user-isolated queries
+_PAYLOAD_INDEXES = (
+    ("user_id", "keyword"),
+    ("document_id", "keyword"),
+    ("chunk_index", "integer"),
+    ("filename", "keyword"),
+    ("embedding_provider", "keyword")
+)
+
+# Facet results at this size may be truncated, so document counts fall back to a scan
+_MAX_FACET_DOCUMENTS = 100000
+
+# Bulk ingests currently pausing HNSW indexing, per collection: [refcount, threshold to restore].
+# Each collection has its own lock so Qdrant calls for one collection never block another.
+_indexing_pauses: Dict[str, List[int]] = {}
+_indexing_pause_locks: Dict[str, threading.Lock] = {}
+_indexing_pause_locks_lock = threading.Lock()
+
+
+def _indexing_pause_lock(collection_name: str) -> threading.Lock:
+    """Get the lock serializing indexing pause changes for one collection"""
+    with _indexing_pause_locks_lock:
+        return _indexing_pause_locks.setdefault(collection_name, threading.Lock())
+
+
+# Last (timestamp_ms, sequence) handed out by _uuid7_batch, kept monotonic per process
+_uuid7_state = [0, 0]
+_uuid7_lock = threading.Lock()
+
+
+def _uuid7_batch(count: int) -> List[str]:
+    """
+    Generate time-ordered (version 7) UUID strings using a single urandom call
+    
+    The 48-bit millisecond timestamp is followed by a 12-bit sequence counter, so IDs
+    sort in generation order within this process and Qdrant appends rather than
+    scatters them. Point IDs are always generated; document_id belongs in the payload.
+    """
+    raw = os.urandom(8 * count)
+    with _uuid7_lock:
+        timestamp_ms, sequence = _uuid7_state
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > timestamp_ms:
+            timestamp_ms, sequence = now_ms, -1
+        ids = []
+        for i in range(count):
+            sequence += 1
+            if sequence > 0xFFF:
+                # Sequence exhausted within one millisecond: borrow the next one
+                timestamp_ms, sequence = timestamp_ms + 1, 0
+            rand_b = int.from_bytes(raw[8 * i:8 * i + 8], "big") & 0x3FFFFFFFFFFFFFFF
+            ids.append(str(uuid.UUID(int=(timestamp_ms << 80) | (0x7 << 76) | (sequence << 64)
+                                     | (0b10 << 62) | rand_b)))
+        _uuid7_state[0], _uuid7_state[1] = timestamp_ms, sequence
+    return ids
+
+
+class _EmbeddingCache:
+    """
+    Process-wide LRU of embeddings keyed by a hash of (provider, model, text)
+    
+    Vectors are stored as float32 arrays, which is the precision Qdrant keeps
+    anyway, to hold several thousand entries in a few tens of MB.
+    """
+    
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, array]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key(namespace: str, text: str) -> bytes:
+        return hashlib.sha256(f"{namespace}\0{text}".encode("utf-8", "surrogatepass")).digest()
+    
+    def get(self, key: bytes) -> Optional[List[float]]:
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is None:
+                return None
+            self._entries.move_to_end(key)
+        return vector.tolist()
+    
+    def put(self, key: bytes, embedding: List[float]):
+        if self.max_entries <= 0 or not any(embedding):
+            # Zero vectors are failure placeholders from the Ollama engine; never cache them
+            return
+        vector = array('f', embedding)
+        with self._lock:
+            self._entries[key] = vector
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+_embedding_cache = _EmbeddingCache(config.embedding_cache_size)
+
+
+class CachedEmbeddingProvider(EmbeddingProvider):
+    """Embedding provider wrapper that only sends uncached texts to the wrapped provider"""
+    
+    def __init__(self, provider: EmbeddingProvider, namespace: str):
+        self.provider = provider
+        self.namespace = f"{namespace}:{getattr(provider, 'model_name', '')}"
+        self._dimension: Optional[int] = None
+    
+    def __getattr__(self, name):
+        # Expose the wrapped provider's attributes (model_name, embedding_engine, ...)
+        if name == "provider":
+            raise AttributeError(name)
+        return getattr(self.provider, name)
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys = [_embedding_cache.key(self.namespace, text) for text in texts]
+        results: List[Optional[List[float]]] = [_embedding_cache.get(key) for key in keys]
+        
+        # Embed each distinct missing text once
+        missing: Dict[bytes, List[int]] = {}
+        for i, (key, embedding) in enumerate(zip(keys, results)):
+            if embedding is None:
+                missing.setdefault(key, []).append(i)
+        
+        if missing:
+            positions = list(missing.values())
+            embeddings = self.provider.embed_documents([texts[p[0]] for p in positions])
+            if len(embeddings) != len(positions):
+                raise RuntimeError(f"Embedding provider returned {len(embeddings)} embeddings "
+                                   f"for {len(positions)} texts")
+            for (key, indexes), embedding in zip(missing.items(), embeddings):
+                _embedding_cache.put(key, embedding)
+                for i in indexes:
+                    results[i] = embedding
+            logger.debug(f"Embedding cache: {len(texts) - sum(map(len, positions))}/{len(texts)} hits")
+        
+        return results
+    
+    def embed_query(self, text: str) -> List[float]:
+        key = _embedding_cache.key(self.namespace, text)
+        embedding = _embedding_cache.get(key)
+        if embedding is None:
+            embedding = self.provider.embed_query(text)
+            _embedding_cache.put(key, embedding)
+        return embedding
+    
+    def get_dimension(self) -> int:
+        # The dimension is fixed per model; Ollama providers probe the server to find it
+        if self._dimension is None:
+            self._dimension = self.provider.get_dimension()
+        return self._dimension
+
+
+# Providers are shared across UserVectorStore instances so their HTTP clients are reused
+_embedding_providers: Dict[tuple, EmbeddingProvider] = {}
+_embedding_providers_lock = threading.Lock()
+
+
 def get_embedding_provider(provider: Optional[str] = None) -> EmbeddingProvider:
     """Get embedding provider based on configuration"""
     provider = provider or config.embedding_provider
     
+    # Key on the settings each provider is built from so configuration changes
+    # produce a fresh provider
     if provider == "openai":
-        return OpenAIEmbeddingProvider()
+        key = (provider, config.openai_embedding_model, config.openai_api_key)
+        factory = OpenAIEmbeddingProvider
     elif provider == "ollama":
-        return OllamaEmbeddingProvider()
+        key = (provider, config.ollama_embedding_model, config.ollama_base_url)
+        factory = OllamaEmbeddingProvider
     else:
         raise ValueError(f"Unknown embedding provider: {provider}")
+    
+    with _embedding_providers_lock:
+        instance = _embedding_providers.get(key)
+        if instance is None:
+            instance = _embedding_providers[key] = CachedEmbeddingProvider(factory(), provider)
+        return instance
 
 
 class UserVectorStore:
@@ -164,6 +345,11 @@ class UserVectorStore:
         # Vector store instance
         self.vector_store = None
         
+        # Make sure filtered queries never run against an unindexed collection
+        if (not self.qdrant_manager.is_indexed(self.collection_name)
+                and self.qdrant_manager.collection_exists(self.collection_name)):
+            self._ensure_indexes()
+        
         logger.info(f"UserVectorStore initialized for user: {user_id}, "
                    f"collection: {self.collection_name}, "
                    f"provider: {self.embedding_provider_name}")
@@ -179,9 +365,12 @@ class UserVectorStore:
                     self.qdrant_manager.delete_collection(self.collection_name)
                 else:
                     logger.info(f"Collection {self.collection_name} already exists")
+                    # The first verification through this client also repairs indexing
+                    # left disabled by a bulk ingest that never finished
+                    if self.qdrant_manager.claim_threshold_check(self.collection_name):
+                        self._recover_indexing_threshold()
                     # Ensure indexes exist even if collection exists
-                    self._ensure_indexes()
-                    return True
+                    return self._ensure_indexes()
             
             # Create collection with proper vector size
             success = self.qdrant_manager.create_collection(
@@ -192,7 +381,7 @@ class UserVectorStore:
             
             if success:
                 # Create indexes for user filtering
-                self._ensure_indexes()
+                success = self._ensure_indexes()
                 
             return success
             
@@ -250,31 +439,139 @@ class UserVectorStore:
             logger.error(f"Error fixing dimension mismatch: {e}")
             return False, f"Failed to fix dimension mismatch: {e}"
     
-    def _ensure_indexes(self):
-        """Ensure all necessary indexes exist"""
-        try:
-            indexes_to_create = [
-                ("user_id", "keyword"),
-                ("document_id", "keyword"),
-                ("chunk_index", "integer"),
-                ("filename", "keyword"),
-                ("embedding_provider", "keyword")
-            ]
-            
-            for field_name, field_type in indexes_to_create:
-                try:
-                    self.qdrant_manager.create_index(
-                        self.collection_name, 
-                        field_name, 
-                        field_type
-                    )
-                    logger.debug(f"Created/verified index for {field_name}")
-                except Exception as e:
-                    # Index might already exist, which is fine
-                    logger.debug(f"Index creation for {field_name} failed (might already exist): {e}")
+    def _ensure_indexes(self) -> bool:
+        """
+        Ensure all necessary payload indexes exist
+        
+        Creating an index that already exists is a no-op in Qdrant, so any failure is
+        real; each failed index is retried once before giving up. The indexes are
+        requested concurrently so verification costs one round-trip, not one per field.
+        
+        Returns:
+            True if every index exists
+        """
+        if self.qdrant_manager.is_indexed(self.collection_name):
+            return True
+        
+        def create_index(field_name: str, field_type: str) -> bool:
+            return (self.qdrant_manager.create_index(self.collection_name, field_name, field_type)
+                    or self.qdrant_manager.create_index(self.collection_name, field_name, field_type))
+        
+        with ThreadPoolExecutor(max_workers=len(_PAYLOAD_INDEXES), thread_name_prefix="index") as executor:
+            results = list(executor.map(lambda index: create_index(*index), _PAYLOAD_INDEXES))
+        failed = [field_name for (field_name, _), created in zip(_PAYLOAD_INDEXES, results) if not created]
+        
+        if failed:
+            logger.error(f"Failed to create payload indexes {failed} on {self.collection_name}")
+            return False
+        
+        self.qdrant_manager.mark_indexed(self.collection_name)
+        logger.debug(f"Verified payload indexes on {self.collection_name}")
+        return True
+    
+    def _pause_indexing(self) -> bool:
+        """
+        Disable HNSW indexing on the collection for a bulk ingest
+        
+        Pauses are reference counted per collection: only the first concurrent ingest
+        disables indexing and only the last one (see _resume_indexing) restores it.
+        
+        Returns:
+            True if the caller holds a pause and must call _resume_indexing
+        """
+        with _indexing_pause_lock(self.collection_name):
+            pause = _indexing_pauses.get(self.collection_name)
+            if pause:
+                pause[0] += 1
+                return True
+            
+            threshold = self.qdrant_manager.get_indexing_threshold(self.collection_name)
+            if threshold is None:
+                return False
+            if threshold == 0:
+                # Left paused by an interrupted ingest, never restore 0
+                threshold = config.qdrant_indexing_threshold
             
-        except Exception as e:
-            logger.warning(f"Error ensuring indexes: {e}")
+            if not self.qdrant_manager.set_indexing_threshold(self.collection_name, 0):
+                return False
+            _indexing_pauses[self.collection_name] = [1, threshold]
+            return True
+    
+    def _resume_indexing(self):
+        """
+        Release a pause taken by _pause_indexing, restoring indexing after the last one
+        
+        If indexing cannot be restored (after one retry), the collection's verified
+        state is dropped so the next verification repairs the threshold.
+        """
+        with _indexing_pause_lock(self.collection_name):
+            pause = _indexing_pauses[self.collection_name]
+            pause[0] -= 1
+            if pause[0] > 0:
+                return
+            del _indexing_pauses[self.collection_name]
+            
+            if not (self.qdrant_manager.set_indexing_threshold(self.collection_name, pause[1])
+                    or self.qdrant_manager.set_indexing_threshold(self.collection_name, pause[1])):
+                logger.error(f"Failed to re-enable indexing on {self.collection_name}, "
+                             f"it will be restored on next verification")
+                self.qdrant_manager.forget_indexed(self.collection_name)
+    
+    def _recover_indexing_threshold(self):
+        """
+        Re-enable HNSW indexing left disabled by an ingest that never finished
+        
+        Pauses are only tracked in this process, so this runs once per collection
+        when it is first verified rather than from every constructor, where it could
+        undo another worker's in-progress bulk ingest.
+        """
+        with _indexing_pause_lock(self.collection_name):
+            if self.collection_name in _indexing_pauses:
+                return
+            if self.qdrant_manager.get_indexing_threshold(self.collection_name) == 0:
+                logger.warning(f"Indexing was left disabled on {self.collection_name}, restoring it")
+                self.qdrant_manager.set_indexing_threshold(self.collection_name,
+                                                           config.qdrant_indexing_threshold)
+    
+    def _embed_in_batches(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts as concurrent sub-batches, preserving input order
+        
+        Sub-batch size and concurrency come from config.embedding_batch_size and
+        config.embedding_max_concurrency; a single sub-batch is embedded inline.
+        """
+        batch_size = max(1, config.embedding_batch_size)
+        batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+        if len(batches) <= 1:
+            return self.embedding_provider.embed_documents(texts)
+        
+        max_workers = max(1, min(config.embedding_max_concurrency, len(batches)))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="embed") as executor:
+            results = executor.map(self.embedding_provider.embed_documents, batches)
+            return [embedding for batch_embeddings in results for embedding in batch_embeddings]
+    
+    @staticmethod
+    def _iter_point_batches(texts: List[str], metadatas: List[Dict[str, Any]],
+                            embeddings: List[List[float]],
+                            batch_size: int) -> Iterator[List[models.PointStruct]]:
+        """Lazily build Qdrant points for chunk texts, batch_size at a time"""
+        for start in range(0, len(texts), batch_size):
+            end = start + batch_size
+            batch_texts = texts[start:end]
+            point_ids = _uuid7_batch(len(batch_texts))
+            yield [
+                models.PointStruct(
+                    id=point_id,
+                    vector=embedding,
+                    payload={
+                        "content": text,
+                        **metadata
+                    }
+                )
+                for point_id, text, metadata, embedding in zip(point_ids, batch_texts,
+                                                               metadatas[start:end],
+                                                               embeddings[start:end])
+            ]
     
     def add_documents(self, documents: List[Document], document_id: Optional[str] = None) -> bool:
         """
@@ -300,50 +597,28 @@ class UserVectorStore:
             if not document_id:
                 document_id = str(uuid.uuid4())
             
-            # Prepare documents with metadata
-            enhanced_documents = []
-            for i, doc in enumerate(documents):
-                # Add user and document metadata
-                enhanced_metadata = doc.metadata.copy()
-                enhanced_metadata.update({
-                    "user_id": self.user_id or "global",
-                    "document_id": document_id,
-                    "chunk_index": i,
-                    "embedding_provider": self.embedding_provider_name
-                })
-                
-                enhanced_doc = Document(
-                    page_content=doc.page_content,
-                    metadata=enhanced_metadata
-                )
-                enhanced_documents.append(enhanced_doc)
+            # Add user and document metadata; only chunk_index varies per chunk
+            base_metadata = {
+                "user_id": self.user_id or "global",
+                "document_id": document_id,
+                "embedding_provider": self.embedding_provider_name
+            }
+            texts = [doc.page_content for doc in documents]
+            metadatas = [
+                {**doc.metadata, **base_metadata, "chunk_index": i}
+                for i, doc in enumerate(documents)
+            ]
             
             # Generate embeddings
-            texts = [doc.page_content for doc in enhanced_documents]
-            embeddings = self.embedding_provider.embed_documents(texts)
-            
-            # Create points for Qdrant
-            points = []
-            for i, (doc, embedding) in enumerate(zip(enhanced_documents, embeddings)):
-                point = models.PointStruct(
-                    id=str(uuid.uuid4()),  # Generate proper UUID string
-                    vector=embedding,
-                    payload={
-                        "content": doc.page_content,
-                        **doc.metadata
-                    }
-                )
-                points.append(point)
+            embeddings = self._embed_in_batches(texts)
             
-            # Add to Qdrant in batches
-            batch_size = config.batch_size
-            total_points = len(points)
+            # Add to Qdrant in batches; points are built one batch at a time
+            batch_size = max(1, config.batch_size)
+            total_points = len(texts)
+            total_batches = (total_points + batch_size - 1) // batch_size
+            point_batches = self._iter_point_batches(texts, metadatas, embeddings, batch_size)
             
-            for i in range(0, total_points, batch_size):
-                batch = points[i:i + batch_size]
-                batch_num = i // batch_size + 1
-                total_batches = (total_points + batch_size - 1) // batch_size
-                
+            def upsert_batch(batch_num: int, batch: List[models.PointStruct]):
                 logger.info(f"Processing batch {batch_num}/{total_batches} "
                            f"({len(batch)} points)")
                 
@@ -351,6 +626,31 @@ class UserVectorStore:
                 if not success:
                     raise Exception(f"Failed to upsert batch {batch_num}")
             
+            # Large ingests pause HNSW indexing so segments are not rebuilt while
+            # vectors stream in; the previous threshold is restored afterwards
+            indexing_paused = total_points > config.bulk_ingest_threshold and self._pause_indexing()
+            
+            try:
+                # A couple of in-flight upserts overlap network round-trips; more than
+                # that mostly adds contention on the Qdrant side
+                parallelism = max(1, min(config.qdrant_upload_parallelism, total_batches))
+                if parallelism == 1:
+                    for batch_num, batch in enumerate(point_batches, 1):
+                        upsert_batch(batch_num, batch)
+                else:
+                    with ThreadPoolExecutor(max_workers=parallelism, thread_name_prefix="qdrant-upsert") as executor:
+                        # Bound in-flight batches so only ~parallelism batches of points exist at once
+                        in_flight = deque()
+                        for batch_num, batch in enumerate(point_batches, 1):
+                            if len(in_flight) >= parallelism:
+                                in_flight.popleft().result()
+                            in_flight.append(executor.submit(upsert_batch, batch_num, batch))
+                        for future in in_flight:
+                            future.result()
+            finally:
+                if indexing_paused:
+                    self._resume_indexing()
+            
             logger.info(f"Successfully added {total_points} documents to vector store")
             return True
             
@@ -362,7 +662,8 @@ class UserVectorStore:
                          query: str, 
                          k: Optional[int] = None,
                          score_threshold: Optional[float] = None,
-                         user_filter: bool = True) -> List[Document]:
+                         user_filter: bool = True,
+                         payload_fields: Optional[List[str]] = None) -> List[Document]:
         """
         Perform similarity search with user isolation
         
@@ -371,12 +672,15 @@ class UserVectorStore:
             k: Number of documents to return
             score_threshold: Minimum similarity score threshold
             user_filter: Whether to filter by current user
+            payload_fields: Only fetch these payload keys (include "content" for page
+                content); None fetches the full payload
             
         Returns:
             List of similar documents
         """
         try:
             k = k or config.max_chunks_per_query
+            with_payload = payload_fields if payload_fields is not None else True
             
             # Generate query embedding
             query_embedding = self.embedding_provider.embed_query(query)
@@ -393,43 +697,24 @@ class UserVectorStore:
                     ]
                 )
             
-            # Search in Qdrant with error handling for missing indexes
-            try:
-                search_results = self.qdrant_manager.search_points(
-                    collection_name=self.collection_name,
-                    query_vector=query_embedding,
-                    limit=k,
-                    score_threshold=score_threshold,
-                    filter_conditions=filter_conditions
-                )
-            except Exception as filter_error:
-                if "Index required" in str(filter_error) and user_filter:
-                    logger.warning(f"Index missing for user filtering, falling back to no filter: {filter_error}")
-                    # Fallback: search without user filter
-                    search_results = self.qdrant_manager.search_points(
-                        collection_name=self.collection_name,
-                        query_vector=query_embedding,
-                        limit=k,
-                        score_threshold=score_threshold,
-                        filter_conditions=None
-                    )
-                    
-                    # Filter results manually by user_id
-                    if self.user_id:
-                        filtered_results = []
-                        for result in search_results:
-                            if result.payload.get("user_id") == self.user_id:
-                                filtered_results.append(result)
-                        search_results = filtered_results[:k]
-                else:
-                    raise filter_error
+            # Search in Qdrant; the user_id index is guaranteed by _ensure_indexes
+            search_results = self.qdrant_manager.search_points(
+                collection_name=self.collection_name,
+                query_vector=query_embedding,
+                limit=k,
+                score_threshold=score_threshold,
+                filter_conditions=filter_conditions,
+                with_payload=with_payload
+            )
             
-            # Convert to LangChain documents
+            # Convert to LangChain documents; payloads are freshly decoded per response,
+            # so the content is popped and the remaining dict reused as metadata
             documents = []
             for result in search_results:
+                payload = result.payload or {}
                 doc = Document(
-                    page_content=result.payload.get("content", ""),
-                    metadata={k: v for k, v in result.payload.items() if k != "content"}
+                    page_content=payload.pop("content", ""),
+                    metadata=payload
                 )
                 documents.append(doc)
             
@@ -439,66 +724,90 @@ class UserVectorStore:
             logger.error(f"Error performing similarity search: {e}")
             return []
     
-    def get_user_documents(self, document_id: Optional[str] = None) -> List[Document]:
+    def _iter_user_point_payloads(self, document_id: Optional[str] = None,
+                                  payload_fields: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
         """
-        Get all documents for current user
+        Lazily scroll payloads of the current user's points, 100 at a time
         
         Args:
             document_id: Filter by specific document ID
+            payload_fields: Only fetch these payload keys (None fetches the full payload)
             
-        Returns:
-            List of user documents
+        Yields:
+            Point payloads
         """
-        try:
-            # Build filter conditions
-            must_conditions = []
-            
-            if self.user_id:
-                must_conditions.append(
-                    models.FieldCondition(
-                        key="user_id",
-                        match=models.MatchValue(value=self.user_id)
-                    )
+        # Build filter conditions
+        must_conditions = []
+        
+        if self.user_id:
+            must_conditions.append(
+                models.FieldCondition(
+                    key="user_id",
+                    match=models.MatchValue(value=self.user_id)
                 )
-            
-            if document_id:
-                must_conditions.append(
-                    models.FieldCondition(
-                        key="document_id",
-                        match=models.MatchValue(value=document_id)
-                    )
+            )
+        
+        if document_id:
+            must_conditions.append(
+                models.FieldCondition(
+                    key="document_id",
+                    match=models.MatchValue(value=document_id)
                 )
+            )
+        
+        filter_conditions = models.Filter(must=must_conditions) if must_conditions else None
+        
+        # Scroll through all matching points
+        offset = None
+        
+        while True:
+            results, next_offset = self.qdrant_manager.scroll_points(
+                collection_name=self.collection_name,
+                limit=100,
+                offset=offset,
+                filter_conditions=filter_conditions,
+                with_vectors=False,
+                with_payload=payload_fields if payload_fields is not None else True
+            )
             
-            filter_conditions = models.Filter(must=must_conditions) if must_conditions else None
+            if not results:
+                break
             
-            # Scroll through all matching documents
-            documents = []
-            offset = None
-            
-            while True:
-                results, next_offset = self.qdrant_manager.scroll_points(
-                    collection_name=self.collection_name,
-                    limit=100,
-                    offset=offset,
-                    filter_conditions=filter_conditions,
-                    with_vectors=False
-                )
-                
-                if not results:
-                    break
-                
-                for point in results:
-                    doc = Document(
-                        page_content=point.payload.get("content", ""),
-                        metadata={k: v for k, v in point.payload.items() if k != "content"}
-                    )
-                    documents.append(doc)
-                
-                offset = next_offset
-                if not offset:
-                    break
+            for point in results:
+                yield point.payload
             
-            return documents
+            offset = next_offset
+            if not offset:
+                break
+    
+    def iter_user_documents(self, document_id: Optional[str] = None) -> Iterator[Document]:
+        """
+        Lazily yield documents for current user without holding them all in memory
+        
+        Args:
+            document_id: Filter by specific document ID
+            
+        Yields:
+            User documents
+        """
+        for payload in self._iter_user_point_payloads(document_id):
+            yield Document(
+                page_content=payload.pop("content", ""),
+                metadata=payload
+            )
+    
+    def get_user_documents(self, document_id: Optional[str] = None) -> List[Document]:
+        """
+        Get all documents for current user
+        
+        Args:
+            document_id: Filter by specific document ID
+            
+        Returns:
+            List of user documents
+        """
+        try:
+            return list(self.iter_user_documents(document_id))
             
         except Exception as e:
             logger.error(f"Error getting user documents: {e}")
@@ -597,28 +906,34 @@ class UserVectorStore:
                 ]
             )
             
-            # Count user documents with error handling
-            try:
-                total_chunks = self.qdrant_manager.count_points(
-                    self.collection_name, 
-                    filter_conditions
-                )
-            except Exception as count_error:
-                if "Index required" in str(count_error):
-                    logger.warning(f"Index missing for user stats, using fallback method: {count_error}")
-                    # Fallback: get all documents and filter manually
-                    all_documents = self.get_user_documents()
-                    total_chunks = len(all_documents)
-                else:
-                    raise count_error
+            # Count user chunks; an approximate count is sufficient for UI counters
+            total_chunks = self.qdrant_manager.count_points(
+                self.collection_name, 
+                filter_conditions,
+                exact=False
+            )
             
-            # Get unique document IDs
-            documents = self.get_user_documents()
-            document_ids = set(doc.metadata.get("document_id") for doc in documents if doc.metadata.get("document_id"))
+            # Count unique document IDs server-side when the facet API is available
+            document_counts = self.qdrant_manager.facet_counts(
+                self.collection_name,
+                "document_id",
+                filter_conditions,
+                limit=_MAX_FACET_DOCUMENTS
+            )
+            if document_counts is not None and len(document_counts) < _MAX_FACET_DOCUMENTS:
+                total_documents = len(document_counts)
+            else:
+                # Fall back to scanning document IDs from payloads, without building Documents
+                document_ids = set()
+                for payload in self._iter_user_point_payloads(payload_fields=["document_id"]):
+                    doc_id = payload.get("document_id")
+                    if doc_id:
+                        document_ids.add(doc_id)
+                total_documents = len(document_ids)
             
             return {
                 "total_chunks": total_chunks,
-                "total_documents": len(document_ids),
+                "total_documents": total_documents,
                 "user_id": self.user_id
             }
             
@@ -4,6 +4,10 @@ Langfuse integration for Zenith - Self-hosted observability and evaluation suppo
 
 import os
 import json
+import atexit
+import queue
+import threading
+import time
 import requests
 from typing import Dict, Any, Optional, List, Union
 from datetime import datetime, timezone
@@ -791,6 +795,71 @@ def flush_langfuse():
         client.flush()
 
 
+# Background flushing keeps the Langfuse HTTP round-trip off the request path
+_FLUSH_BATCH_SIZE = 10
+_FLUSH_INTERVAL_SECONDS = 2.0
+_flush_queue: "queue.Queue[None]" = queue.Queue()
+_flush_worker: Optional[threading.Thread] = None
+_flush_worker_lock = threading.Lock()
+
+
+def _flush_safely():
+    """Flush traces, logging instead of raising on failure"""
+    try:
+        flush_langfuse()
+    except Exception as e:
+        logger.warning(f"Background Langfuse flush failed: {e}")
+
+
+def _flush_worker_loop():
+    """Flush every _FLUSH_BATCH_SIZE requests or _FLUSH_INTERVAL_SECONDS after the first pending one"""
+    pending = 0
+    deadline = None
+    while True:
+        timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+        try:
+            _flush_queue.get(timeout=timeout)
+            pending += 1
+            if deadline is None:
+                deadline = time.monotonic() + _FLUSH_INTERVAL_SECONDS
+            if pending < _FLUSH_BATCH_SIZE and time.monotonic() < deadline:
+                continue
+        except queue.Empty:
+            pass
+        
+        pending = 0
+        deadline = None
+        _flush_safely()
+
+
+def _drain_and_flush():
+    """Flush whatever is still pending when the process exits"""
+    if _flush_worker is not None:
+        _flush_safely()
+
+
+def flush_langfuse_async():
+    """Schedule a Langfuse flush on the background worker without blocking the caller"""
+    global _flush_worker
+    
+    if get_langfuse_client() is None:
+        return
+    
+    if _flush_worker is None:
+        with _flush_worker_lock:
+            if _flush_worker is None:
+                worker = threading.Thread(
+                    target=_flush_worker_loop,
+                    name="langfuse-flush",
+                    daemon=True
+                )
+                worker.start()
+                atexit.register(_drain_and_flush)
+                _flush_worker = worker
+    
+    _flush_queue.put_nowait(None)
+
+
 def trace_session_if_enabled(session_id: str,
                              user_id: Optional[str] = None,
                              session_data: Optional[Dict[str, Any]] = None,
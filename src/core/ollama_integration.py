@@ -31,11 +31,13 @@ class OllamaClient:
         """Initialize Ollama client"""
         self.base_url = base_url or config.ollama_base_url
         self.timeout = 120  # 2 minutes timeout for model operations
+        # Keep-alive connection pool shared by all requests from this client
+        self.session = requests.Session()
         
     def health_check(self) -> bool:
         """Check if Ollama is running and accessible"""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=10)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=10)
             return response.status_code == 200
         except Exception as e:
             logger.error(f"Ollama health check failed: {e}")
@@ -44,7 +46,7 @@ class OllamaClient:
     def list_models(self) -> List[OllamaModel]:
         """List available models in Ollama"""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=30)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=30)
             response.raise_for_status()
             
             data = response.json()
@@ -72,7 +74,7 @@ class OllamaClient:
             logger.info(f"Pulling Ollama model: {model_name}")
             
             payload = {"name": model_name}
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/pull",
                 json=payload,
                 timeout=self.timeout,
@@ -108,7 +110,7 @@ class OllamaClient:
                 "stream": stream
             }
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/chat",
                 json=payload,
                 timeout=self.timeout
@@ -132,7 +134,7 @@ class OllamaClient:
                 "prompt": text
             }
             
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/embeddings",
                 json=payload,
                 timeout=self.timeout
@@ -146,6 +148,35 @@ class OllamaClient:
             logger.error(f"Embedding generation failed: {e}")
             return None
     
+    def generate_embeddings_batch(self, texts: List[str], model: str) -> Optional[List[List[float]]]:
+        """
+        Generate embeddings for several texts in one request using /api/embed
+        
+        Returns None if the server does not support batch embedding (older Ollama
+        versions) or the request fails, so callers can fall back to per-text calls.
+        """
+        try:
+            payload = {
+                "model": model,
+                "input": texts
+            }
+            
+            response = self.session.post(
+                f"{self.base_url}/api/embed",
+                json=payload,
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            
+            embeddings = response.json().get("embeddings")
+            if not embeddings or len(embeddings) != len(texts):
+                return None
+            return embeddings
+            
+        except Exception as e:
+            logger.warning(f"Batch embedding generation failed: {e}")
+            return None
+    
     def model_exists(self, model_name: str) -> bool:
         """Check if a model exists locally"""
         models = self.list_models()
@@ -155,9 +186,9 @@ class OllamaClient:
 class OllamaChatEngine:
     """Chat engine using Ollama models"""
     
-    def __init__(self, model_name: Optional[str] = None):
+    def __init__(self, model_name: Optional[str] = None, base_url: Optional[str] = None):
         """Initialize Ollama chat engine"""
-        self.client = OllamaClient()
+        self.client = OllamaClient(base_url)
         self.model_name = model_name or config.ollama_chat_model
         self.conversation_history: List[Dict[str, str]] = []
         
@@ -169,24 +200,9 @@ class OllamaChatEngine:
     
     def chat(self, message: str, system_prompt: Optional[str] = None) -> str:
         """Generate chat response"""
-        # Add system message if provided
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        
-        # Add conversation history
-        messages.extend(self.conversation_history)
-        
-        # Add current message
-        messages.append({"role": "user", "content": message})
-        
-        # Generate response
-        response = self.client.generate_chat_completion(messages, self.model_name)
-        
-        if "error" in response:
-            raise RuntimeError(f"Chat generation failed: {response['error']}")
-        
-        assistant_message = response["message"]["content"]
+        # Conversation history plus current message
+        messages = self.conversation_history + [{"role": "user", "content": message}]
+        assistant_message = self.chat_with_messages(messages, system_prompt)
         
         # Update conversation history
         self.conversation_history.append({"role": "user", "content": message})
@@ -198,6 +214,20 @@ class OllamaChatEngine:
         
         return assistant_message
     
+    def chat_with_messages(self, messages: List[Dict[str, str]], system_prompt: Optional[str] = None) -> str:
+        """Generate chat response for a complete message list, without using or updating conversation history"""
+        # Add system message if provided
+        if system_prompt:
+            messages = [{"role": "system", "content": system_prompt}] + messages
+        
+        # Generate response
+        response = self.client.generate_chat_completion(messages, self.model_name)
+        
+        if "error" in response:
+            raise RuntimeError(f"Chat generation failed: {response['error']}")
+        
+        return response["message"]["content"]
+    
     def clear_history(self):
         """Clear conversation history"""
         self.conversation_history = []
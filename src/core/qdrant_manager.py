@@ -3,6 +3,7 @@ Qdrant Manager for Zenith - Supports both local and cloud instances
 """
 
 from typing import Optional, List, Dict, Any, Union
+import threading
 from qdrant_client import QdrantClient
 from qdrant_client.http import models
 from qdrant_client.http.models import Distance, VectorParams
@@ -27,6 +28,11 @@ class QdrantManager:
         self.mode = mode or config.qdrant_mode
         self.client = self._create_client()
         
+        # Collections whose payload indexes / indexing threshold have been verified through this client
+        self._indexed_collections = set()
+        self._threshold_checked_collections = set()
+        self._indexed_collections_lock = threading.Lock()
+        
     def _create_client(self) -> QdrantClient:
         """Create Qdrant client based on configuration"""
         try:
@@ -98,6 +104,7 @@ class QdrantManager:
     
     def delete_collection(self, collection_name: str) -> bool:
         """Delete a collection"""
+        self.forget_indexed(collection_name)
         try:
             self.client.delete_collection(collection_name)
             logger.info(f"Deleted collection: {collection_name}")
@@ -106,6 +113,29 @@ class QdrantManager:
             logger.error(f"Failed to delete collection {collection_name}: {e}")
             return False
     
+    def is_indexed(self, collection_name: str) -> bool:
+        """Check if the payload indexes of a collection were verified through this client"""
+        return collection_name in self._indexed_collections
+    
+    def mark_indexed(self, collection_name: str):
+        """Record that the payload indexes of a collection have been verified"""
+        with self._indexed_collections_lock:
+            self._indexed_collections.add(collection_name)
+    
+    def claim_threshold_check(self, collection_name: str) -> bool:
+        """Return True only the first time a collection's indexing threshold should be checked"""
+        with self._indexed_collections_lock:
+            if collection_name in self._threshold_checked_collections:
+                return False
+            self._threshold_checked_collections.add(collection_name)
+            return True
+    
+    def forget_indexed(self, collection_name: str):
+        """Drop the verified records of a collection so it is verified again"""
+        with self._indexed_collections_lock:
+            self._indexed_collections.discard(collection_name)
+            self._threshold_checked_collections.discard(collection_name)
+    
     def collection_exists(self, collection_name: str) -> bool:
         """Check if a collection exists"""
         try:
@@ -131,6 +161,28 @@ class QdrantManager:
             logger.error(f"Error getting collection info for {collection_name}: {e}")
             return None
     
+    def get_indexing_threshold(self, collection_name: str) -> Optional[int]:
+        """Get the optimizer indexing threshold of a collection"""
+        try:
+            info = self.client.get_collection(collection_name)
+            return info.config.optimizer_config.indexing_threshold
+        except Exception as e:
+            logger.error(f"Error getting indexing threshold for {collection_name}: {e}")
+            return None
+    
+    def set_indexing_threshold(self, collection_name: str, indexing_threshold: int) -> bool:
+        """Set the optimizer indexing threshold of a collection (0 disables indexing)"""
+        try:
+            self.client.update_collection(
+                collection_name=collection_name,
+                optimizer_config=models.OptimizersConfigDiff(indexing_threshold=indexing_threshold)
+            )
+            logger.debug(f"Set indexing threshold of {collection_name} to {indexing_threshold}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to set indexing threshold for {collection_name}: {e}")
+            return False
+    
     def upsert_points(self, collection_name: str, points: List[models.PointStruct]) -> bool:
         """Upsert points into a collection"""
         try:
@@ -144,15 +196,32 @@ class QdrantManager:
             logger.error(f"Failed to upsert points to {collection_name}: {e}")
             return False
     
+    def overwrite_payload(self, collection_name: str, payload: Dict[str, Any],
+                          point_ids: List[Union[str, int]]) -> bool:
+        """Replace the payload of existing points without resending their vectors"""
+        try:
+            self.client.overwrite_payload(
+                collection_name=collection_name,
+                payload=payload,
+                points=point_ids
+            )
+            logger.debug(f"Overwrote payload of {len(point_ids)} points in {collection_name}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to overwrite payload in {collection_name}: {e}")
+            return False
+    
     def search_points(self, collection_name: str, query_vector: List[float],
                      limit: int = 10, score_threshold: Optional[float] = None,
-                     filter_conditions: Optional[models.Filter] = None) -> List[models.ScoredPoint]:
+                     filter_conditions: Optional[models.Filter] = None,
+                     with_payload: Union[bool, List[str]] = True) -> List[models.ScoredPoint]:
         """Search for similar vectors"""
         try:
             search_params = {
                 'collection_name': collection_name,
                 'query_vector': query_vector,
-                'limit': limit
+                'limit': limit,
+                'with_payload': with_payload
             }
             
             if score_threshold is not None:
@@ -168,13 +237,15 @@ class QdrantManager:
             return []
     
     def get_points(self, collection_name: str, point_ids: List[Union[str, int]],
-                  with_vectors: bool = False) -> List[models.Record]:
+                  with_vectors: bool = False,
+                  with_payload: Union[bool, List[str], models.PayloadSelector] = True) -> List[models.Record]:
         """Retrieve specific points by ID"""
         try:
             return self.client.retrieve(
                 collection_name=collection_name,
                 ids=point_ids,
-                with_vectors=with_vectors
+                with_vectors=with_vectors,
+                with_payload=with_payload
             )
         except Exception as e:
             logger.error(f"Failed to retrieve points from {collection_name}: {e}")
@@ -183,13 +254,15 @@ class QdrantManager:
     def scroll_points(self, collection_name: str, limit: int = 100,
                      offset: Optional[Union[str, int]] = None,
                      filter_conditions: Optional[models.Filter] = None,
-                     with_vectors: bool = False) -> tuple:
+                     with_vectors: bool = False,
+                     with_payload: Union[bool, List[str]] = True) -> tuple:
         """Scroll through points in a collection"""
         try:
             scroll_params = {
                 'collection_name': collection_name,
                 'limit': limit,
-                'with_vectors': with_vectors
+                'with_vectors': with_vectors,
+                'with_payload': with_payload
             }
             
             if offset is not None:
@@ -235,10 +308,11 @@ class QdrantManager:
             return False
     
     def count_points(self, collection_name: str, 
-                    filter_conditions: Optional[models.Filter] = None) -> int:
-        """Count points in collection"""
+                    filter_conditions: Optional[models.Filter] = None,
+                    exact: bool = True) -> int:
+        """Count points in collection (exact=False trades precision for speed)"""
         try:
-            count_params = {'collection_name': collection_name}
+            count_params = {'collection_name': collection_name, 'exact': exact}
             if filter_conditions:
                 count_params['count_filter'] = filter_conditions
             
@@ -248,6 +322,25 @@ class QdrantManager:
             logger.error(f"Failed to count points in {collection_name}: {e}")
             return 0
     
+    def facet_counts(self, collection_name: str, key: str,
+                     filter_conditions: Optional[models.Filter] = None,
+                     limit: int = 10) -> Optional[Dict[Any, int]]:
+        """
+        Count points per distinct value of an indexed payload field
+        
+        Returns None if the facet API is unavailable (client or server older than 1.12)
+        """
+        try:
+            facet_params = {'collection_name': collection_name, 'key': key, 'limit': limit}
+            if filter_conditions:
+                facet_params['facet_filter'] = filter_conditions
+            
+            result = self.client.facet(**facet_params)
+            return {hit.value: hit.count for hit in result.hits}
+        except Exception as e:
+            logger.debug(f"Facet on {key} unavailable for {collection_name}: {e}")
+            return None
+    
     def create_index(self, collection_name: str, field_name: str, 
                     field_type: str = "keyword") -> bool:
         """Create an index on a payload field"""
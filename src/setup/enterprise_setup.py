@@ -270,7 +270,7 @@ class EnterpriseSetupManager:
         try:
             # Check system requirements
             checks = {
-                'python_version': sys.version_info >= (3, 9),
+                'python_version': sys.version_info >= (3, 10),
                 'write_permissions': self._check_write_permissions(),
                 'disk_space': self._check_disk_space(),
                 'dependencies': self._check_dependencies()
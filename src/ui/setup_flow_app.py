@@ -317,7 +317,7 @@ class SetupFlowManager:
                     st.rerun()
         else:
             st.error("⚠️ Please resolve the above issues before continuing.")
-            st.info("💡 **Tip:** Make sure you have write permissions and Python 3.9+ installed.")
+            st.info("💡 **Tip:** Make sure you have write permissions and Python 3.10+ installed.")
     
     def _check_prerequisites(self) -> List[Tuple[str, bool, str]]:
         """Check system prerequisites"""
@@ -325,10 +325,10 @@ class SetupFlowManager:
         
         # Check Python version
         python_version = sys.version_info
-        if python_version >= (3, 9):
+        if python_version >= (3, 10):
             checks.append(("Python Version", True, f"Python {python_version.major}.{python_version.minor} ✓"))
         else:
-            checks.append(("Python Version", False, f"Python 3.9+ required, found {python_version.major}.{python_version.minor}"))
+            checks.append(("Python Version", False, f"Python 3.10+ required, found {python_version.major}.{python_version.minor}"))
         
         # Check write permissions
         try:
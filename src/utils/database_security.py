@@ -171,6 +171,84 @@ def validate_database_path(path: str, project_root: Optional[Path] = None) -> Tu
         logger.error(f"Path validation error: {e}")
         return False, f"Path validation failed: {str(e)}", None
 
+def open_secure_sqlite_connection(
+    db_path: Path,
+    timeout: float = DEFAULT_SQLITE_TIMEOUT,
+    read_only: bool = False,
+    cached_statements: int = 128
+) -> sqlite3.Connection:
+    """
+    Open a SQLite connection with the secure settings used across Zenith.
+    
+    The caller owns the returned connection and must close it; prefer
+    secure_sqlite_connection() unless the connection is pooled.
+    
+    Args:
+        db_path: Validated database path
+        timeout: Connection timeout in seconds
+        read_only: Whether to open in read-only mode
+        cached_statements: Size of the connection's prepared statement cache
+        
+    Returns:
+        sqlite3.Connection: Configured database connection
+        
+    Raises:
+        DatabaseSecurityError: If the path is invalid
+        sqlite3.Error: For database-specific errors
+    """
+    if not isinstance(db_path, Path):
+        raise InvalidDatabasePathError("Database path must be a Path object")
+    
+    if not db_path.exists() and read_only:
+        raise DatabaseSecurityError(f"Database file does not exist: {db_path}")
+    
+    start_time = time.time()
+    
+    # Create parent directory if it doesn't exist (securely)
+    if not read_only:
+        parent_dir = db_path.parent
+        if not parent_dir.exists():
+            # Validate parent directory is also within project bounds
+            project_root = get_project_root()
+            try:
+                parent_dir.relative_to(project_root)
+            except ValueError:
+                raise PathTraversalError(f"Database directory outside project: {parent_dir}")
+            
+            # Create directory with secure permissions
+            parent_dir.mkdir(parents=True, exist_ok=True, mode=0o755)
+            logger.info(f"Created database directory: {parent_dir}")
+    
+    # Open connection with timeout and security settings
+    connection_uri = f"file:{db_path}"
+    if read_only:
+        connection_uri += "?mode=ro"
+    
+    connection = sqlite3.connect(
+        connection_uri, 
+        timeout=timeout,
+        uri=True,
+        check_same_thread=False,  # Allow connection to be used across threads
+        cached_statements=cached_statements
+    )
+    
+    try:
+        # Configure connection security settings
+        connection.execute("PRAGMA foreign_keys = ON")  # Enforce foreign key constraints
+        connection.execute("PRAGMA journal_mode = WAL")  # Use Write-Ahead Logging for better concurrency
+        connection.execute("PRAGMA synchronous = FULL")  # Ensure data integrity
+        connection.execute("PRAGMA temp_store = MEMORY")  # Store temp data in memory for security
+        connection.execute("PRAGMA secure_delete = ON")  # Overwrite deleted data
+    except Exception:
+        connection.close()
+        raise
+    
+    # Set row factory for easier data access
+    connection.row_factory = sqlite3.Row
+    
+    logger.debug(f"Opened secure SQLite connection to {db_path} in {time.time() - start_time:.3f}s")
+    return connection
+
 @contextlib.contextmanager
 def secure_sqlite_connection(
     db_path: Path, 
@@ -202,47 +280,9 @@ def secure_sqlite_connection(
         raise DatabaseSecurityError(f"Database file does not exist: {db_path}")
     
     connection = None
-    start_time = time.time()
     
     try:
-        # Create parent directory if it doesn't exist (securely)
-        if not read_only:
-            parent_dir = db_path.parent
-            if not parent_dir.exists():
-                # Validate parent directory is also within project bounds
-                project_root = get_project_root()
-                try:
-                    parent_dir.relative_to(project_root)
-                except ValueError:
-                    raise PathTraversalError(f"Database directory outside project: {parent_dir}")
-                
-                # Create directory with secure permissions
-                parent_dir.mkdir(parents=True, exist_ok=True, mode=0o755)
-                logger.info(f"Created database directory: {parent_dir}")
-        
-        # Open connection with timeout and security settings
-        connection_uri = f"file:{db_path}"
-        if read_only:
-            connection_uri += "?mode=ro"
-        
-        connection = sqlite3.connect(
-            connection_uri, 
-            timeout=timeout,
-            uri=True,
-            check_same_thread=False  # Allow connection to be used across threads
-        )
-        
-        # Configure connection security settings
-        connection.execute("PRAGMA foreign_keys = ON")  # Enforce foreign key constraints
-        connection.execute("PRAGMA journal_mode = WAL")  # Use Write-Ahead Logging for better concurrency
-        connection.execute("PRAGMA synchronous = FULL")  # Ensure data integrity
-        connection.execute("PRAGMA temp_store = MEMORY")  # Store temp data in memory for security
-        connection.execute("PRAGMA secure_delete = ON")  # Overwrite deleted data
-        
-        # Set row factory for easier data access
-        connection.row_factory = sqlite3.Row
-        
-        logger.debug(f"Opened secure SQLite connection to {db_path} in {time.time() - start_time:.3f}s")
+        connection = open_secure_sqlite_connection(db_path, timeout, read_only)
         
         yield connection
         
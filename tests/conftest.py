@@ -0,0 +1,33 @@
+"""
+Shared fixtures for Zenith tests
+"""
+
+import importlib
+import importlib.util
+import sys
+import types
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+
+@pytest.fixture
+def config_manager_module(monkeypatch):
+    """
+    Import enhanced_configuration_manager for a test
+
+    The module imports src.core.secrets_manager, which is not part of every
+    checkout; a stub stands in for it when it is missing.
+    """
+    if importlib.util.find_spec("src.core.secrets_manager") is None:
+        secrets_manager = types.ModuleType("src.core.secrets_manager")
+        secrets_manager.get_secrets_manager = MagicMock()
+        secrets_manager.SecretType = MagicMock()
+        monkeypatch.setitem(sys.modules, "src.core.secrets_manager", secrets_manager)
+    monkeypatch.delitem(sys.modules, "src.core.enhanced_configuration_manager", raising=False)
+    return importlib.import_module("src.core.enhanced_configuration_manager")
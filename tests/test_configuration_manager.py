@@ -0,0 +1,140 @@
+"""
+Tests for enhanced_configuration_manager.py
+Tests history-based rollback and configuration change callbacks
+"""
+
+import gc
+import pytest
+import tempfile
+import threading
+from pathlib import Path
+
+
+class TestConfigurationRollback:
+    """Test DatabaseConfigurationStore.rollback against the change history"""
+
+    @pytest.fixture(autouse=True)
+    def store(self, config_manager_module):
+        """Setup a store on a temporary database"""
+        temp_dir = tempfile.mkdtemp()
+        self.store = config_manager_module.DatabaseConfigurationStore(
+            str(Path(temp_dir) / "config.db")
+        )
+        yield self.store
+        self.store.close()
+
+    def test_rollback_update_restores_previous_value(self):
+        """Test that rolling back one update restores the value before it"""
+        self.store.set_value("app.port", 8501)
+        self.store.set_value("app.port", 9000)
+
+        assert self.store.rollback("app.port", steps=1) == (True, 8501)
+        assert self.store.get_value("app.port") == 8501
+
+    def test_rollback_create_deletes_key(self):
+        """Test that rolling back the change that created a key removes it"""
+        self.store.set_value("app.new_key", "value")
+
+        assert self.store.rollback("app.new_key", steps=1) == (True, None)
+        assert self.store.get_value("app.new_key") is None
+        assert "app.new_key" not in self.store.list_keys("default")
+
+    def test_rollback_across_delete(self):
+        """Test rollback targets around a delete in the middle of the history"""
+        self.store.set_value("app.mode", "a")
+        self.store.delete_value("app.mode")
+        self.store.set_value("app.mode", "b")
+
+        # One step back is the delete: the key ends up unset
+        assert self.store.rollback("app.mode", steps=1) == (True, None)
+        assert self.store.get_value("app.mode") is None
+
+        # History is now set a, delete, set b, delete; three steps back is set a
+        assert self.store.rollback("app.mode", steps=3) == (True, "a")
+        assert self.store.get_value("app.mode") == "a"
+
+    def test_rollback_without_enough_history(self):
+        """Test that asking for more steps than recorded changes fails without writing"""
+        self.store.set_value("app.port", 8501)
+
+        assert self.store.rollback("app.port", steps=2) == (False, None)
+        assert self.store.rollback("app.missing", steps=1) == (False, None)
+        assert self.store.get_value("app.port") == 8501
+        assert len(self.store.get_history("app.port", "default")) == 1
+
+    def test_rollback_rejected_by_validator(self):
+        """Test that a validator rejecting the target value leaves the key unchanged"""
+        self.store.set_value("app.port", 80)
+        self.store.set_value("app.port", 9000)
+
+        result = self.store.rollback(
+            "app.port", steps=1,
+            validator=lambda value: (value >= 1024, "Port must be >= 1024")
+        )
+
+        assert result == (False, None)
+        assert self.store.get_value("app.port") == 9000
+        assert len(self.store.get_history("app.port", "default")) == 2
+
+
+class CallbackOwner:
+    """Object whose bound method is registered as a change callback"""
+
+    def __init__(self):
+        self.calls = []
+        self.threads = []
+
+    def on_change(self, key, value, environment):
+        self.calls.append((key, value, environment))
+        self.threads.append(threading.current_thread())
+
+
+class TestConfigurationChangeCallbacks:
+    """Test weakly held change callbacks and their asynchronous delivery"""
+
+    @pytest.fixture(autouse=True)
+    def manager(self, config_manager_module):
+        """Setup a manager on a temporary database"""
+        temp_dir = tempfile.mkdtemp()
+        self.manager = config_manager_module.EnhancedConfigurationManager(
+            str(Path(temp_dir) / "config.db"), "development", enable_hot_reload=False
+        )
+        yield self.manager
+        self.manager.shutdown()
+
+    def wait_for_callbacks(self):
+        """Wait until every change queued so far has been delivered"""
+        self.manager._cb_executor.submit(lambda: None).result(timeout=5)
+
+    def test_live_bound_method_called_off_writer_thread(self):
+        """Test that a bound method callback is called, in write order, on the dispatch thread"""
+        owner = CallbackOwner()
+        self.manager.register_change_callback("app.port", owner.on_change)
+
+        for port in (9000, 9001, 9002):
+            assert self.manager.set_config("app.port", port)
+        self.wait_for_callbacks()
+
+        assert owner.calls == [
+            ("app.port", 9000, "development"),
+            ("app.port", 9001, "development"),
+            ("app.port", 9002, "development"),
+        ]
+        assert all(thread is not threading.current_thread() for thread in owner.threads)
+
+    def test_collected_owner_pruned(self):
+        """Test that a callback whose owner was collected is dropped, while functions are kept"""
+        owner = CallbackOwner()
+        function_calls = []
+        self.manager.register_change_callback("app.port", owner.on_change)
+        self.manager.register_change_callback("app.port", lambda *args: function_calls.append(args))
+
+        del owner
+        gc.collect()
+
+        assert self.manager.set_config("app.port", 9000)
+        self.wait_for_callbacks()
+
+        assert function_calls == [("app.port", 9000, "development")]
+        assert len(self.manager._change_callbacks["app.port"]) == 1
+
@@ -185,6 +185,70 @@ class TestSecureSQLiteConnection:
                 conn.execute("INVALID SQL SYNTAX")
 
 
+class TestConfigurationStorePool:
+    """Test the configuration store connection pool under concurrent use"""
+    
+    def setup_method(self):
+        """Setup test database"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = Path(self.temp_dir) / "config.db"
+
+    def test_concurrent_writers_respect_pool_size(self, config_manager_module):
+        """Test that slow connection opens neither overshoot the pool size nor fail committed writes"""
+        from concurrent.futures import ThreadPoolExecutor
+        import time
+        
+        store = config_manager_module.DatabaseConfigurationStore(
+            str(self.db_path), pool_min_size=0, pool_max_size=2
+        )
+        open_connection = store._open_connection
+        opened_totals = []
+        
+        def slow_open():
+            # Widen the window between reserving a slot and opening the connection
+            time.sleep(0.02)
+            opened_totals.append(store.get_pool_status()["total"])
+            return open_connection()
+        
+        try:
+            with patch.object(store, "_open_connection", side_effect=slow_open):
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    results = list(executor.map(
+                        lambda i: store.set_value(f"pool.key{i}", i), range(16)
+                    ))
+            
+            assert all(results)
+            assert 1 <= len(opened_totals) <= 2
+            assert max(opened_totals) <= 2
+            status = store.get_pool_status()
+            assert status["total"] <= 2
+            assert status["active"] == 0
+            assert status["idle"] == status["total"]
+            assert [store.get_value(f"pool.key{i}") for i in range(16)] == list(range(16))
+        finally:
+            store.close()
+
+    def test_surplus_connection_closed_on_release(self, config_manager_module):
+        """Test that a connection released into a full pool is closed rather than raising"""
+        store = config_manager_module.DatabaseConfigurationStore(
+            str(self.db_path), pool_min_size=2, pool_max_size=2
+        )
+        surplus = MagicMock()
+        
+        try:
+            # Simulate a borrowed connection beyond the pool size
+            with store._pool_lock:
+                store._pool_total += 1
+                store._pool_active += 1
+            
+            store._release_connection(surplus)
+            
+            surplus.close.assert_called_once()
+            assert store.get_pool_status() == {"active": 0, "idle": 2, "total": 2, "max_size": 2}
+        finally:
+            store.close()
+
+
 class TestDatabaseSettingsSanitization:
     """Test database settings sanitization and validation"""
     
@@ -0,0 +1,177 @@
+"""
+Tests for enhanced_vector_store.py
+Tests bulk-ingest indexing pauses and the embedding cache with mocked providers
+"""
+
+import pytest
+from unittest.mock import patch, MagicMock
+
+from src.core import enhanced_vector_store
+from src.core.enhanced_vector_store import UserVectorStore
+
+
+class FakeQdrantManager:
+    """QdrantManager stand-in that keeps one collection's indexing threshold in memory"""
+
+    def __init__(self, threshold=20000):
+        self.threshold = threshold
+        self.fail_sets = 0
+        self.set_calls = []
+        self.forgotten = []
+        self.threshold_checked = False
+
+    def is_indexed(self, collection_name):
+        return True
+
+    def collection_exists(self, collection_name):
+        return True
+
+    def claim_threshold_check(self, collection_name):
+        first, self.threshold_checked = not self.threshold_checked, True
+        return first
+
+    def forget_indexed(self, collection_name):
+        self.forgotten.append(collection_name)
+
+    def get_indexing_threshold(self, collection_name):
+        return self.threshold
+
+    def set_indexing_threshold(self, collection_name, indexing_threshold):
+        self.set_calls.append(indexing_threshold)
+        if self.fail_sets:
+            self.fail_sets -= 1
+            return False
+        self.threshold = indexing_threshold
+        return True
+
+
+@pytest.fixture
+def qdrant_manager():
+    """Patch the shared Qdrant manager and embedding provider used by UserVectorStore"""
+    manager = FakeQdrantManager()
+    with patch.object(enhanced_vector_store, "get_qdrant_client", return_value=manager), \
+         patch.object(enhanced_vector_store, "get_embedding_provider", return_value=MagicMock()):
+        yield manager
+    enhanced_vector_store._indexing_pauses.clear()
+
+
+class TestIndexingPause:
+    """Test reference-counted HNSW indexing pauses for bulk ingests"""
+
+    def make_store(self):
+        return UserVectorStore(user_id="user-1", collection_name="test_collection")
+
+    def test_overlapping_pauses_restore_once(self, qdrant_manager):
+        """Test that only the last of two overlapping ingests restores indexing"""
+        first, second = self.make_store(), self.make_store()
+
+        assert first._pause_indexing() is True
+        assert second._pause_indexing() is True
+        assert qdrant_manager.threshold == 0
+
+        first._resume_indexing()
+        assert qdrant_manager.threshold == 0
+
+        second._resume_indexing()
+        assert qdrant_manager.threshold == 20000
+        assert qdrant_manager.set_calls == [0, 20000]
+
+    def test_zero_threshold_is_never_restored(self, qdrant_manager):
+        """Test that a threshold left at 0 is replaced with the configured one"""
+        qdrant_manager.threshold = 0
+        store = self.make_store()
+
+        with patch.object(enhanced_vector_store.config, "qdrant_indexing_threshold", 15000):
+            assert store._pause_indexing() is True
+            store._resume_indexing()
+
+        assert qdrant_manager.threshold == 15000
+
+    def test_failed_restore_is_retried_then_reverified(self, qdrant_manager):
+        """Test that a failed restore is retried once and then left for the next verification"""
+        store = self.make_store()
+        assert store._pause_indexing() is True
+
+        qdrant_manager.fail_sets = 2
+        store._resume_indexing()
+
+        assert qdrant_manager.set_calls == [0, 20000, 20000]
+        assert qdrant_manager.forgotten == ["test_collection"]
+        assert "test_collection" not in enhanced_vector_store._indexing_pauses
+
+    def test_stale_pause_recovered_on_first_verification_only(self, qdrant_manager):
+        """Test that indexing left at 0 is repaired by create_collection, not by constructors"""
+        qdrant_manager.threshold = 0
+        store = self.make_store()
+        assert qdrant_manager.threshold == 0
+
+        assert store.create_collection() is True
+        assert qdrant_manager.threshold == enhanced_vector_store.config.qdrant_indexing_threshold
+
+        # Later verifications leave the threshold alone, e.g. another worker's bulk ingest
+        qdrant_manager.threshold = 0
+        assert self.make_store().create_collection() is True
+        assert qdrant_manager.threshold == 0
+
+
+class CountingProvider(enhanced_vector_store.EmbeddingProvider):
+    """Embedding provider that records every batch it is asked to embed"""
+
+    model_name = "counting-model"
+
+    def __init__(self, drop_last=False):
+        self.batches = []
+        self.drop_last = drop_last
+
+    def embed_documents(self, texts):
+        self.batches.append(list(texts))
+        embeddings = [[0.0, 0.0] if text == "failed" else [float(len(text)), 1.0] for text in texts]
+        return embeddings[:-1] if self.drop_last else embeddings
+
+    def embed_query(self, text):
+        return self.embed_documents([text])[0]
+
+    def get_dimension(self):
+        return 2
+
+
+class TestCachedEmbeddingProvider:
+    """Test the content-keyed embedding cache in front of a provider"""
+
+    @pytest.fixture(autouse=True)
+    def embedding_cache(self):
+        """Give each test an empty embedding cache"""
+        cache = enhanced_vector_store._EmbeddingCache(max_entries=16)
+        with patch.object(enhanced_vector_store, "_embedding_cache", cache):
+            yield cache
+
+    def test_duplicate_missing_texts_embedded_once(self):
+        """Test that repeated uncached texts are sent to the provider once and cached"""
+        provider = CountingProvider()
+        cached = enhanced_vector_store.CachedEmbeddingProvider(provider, "test")
+
+        embeddings = cached.embed_documents(["a", "bb", "a", "bb", "ccc"])
+
+        assert provider.batches == [["a", "bb", "ccc"]]
+        assert embeddings == [[1.0, 1.0], [2.0, 1.0], [1.0, 1.0], [2.0, 1.0], [3.0, 1.0]]
+
+        assert cached.embed_documents(["bb", "dddd"]) == [[2.0, 1.0], [4.0, 1.0]]
+        assert provider.batches[-1] == ["dddd"]
+
+    def test_zero_vectors_not_cached(self):
+        """Test that zero-vector failure placeholders are returned but embedded again next time"""
+        provider = CountingProvider()
+        cached = enhanced_vector_store.CachedEmbeddingProvider(provider, "test")
+
+        assert cached.embed_documents(["failed"]) == [[0.0, 0.0]]
+        cached.embed_documents(["failed"])
+
+        assert provider.batches == [["failed"], ["failed"]]
+
+    def test_short_provider_response_raises(self):
+        """Test that a provider returning fewer embeddings than texts fails loudly"""
+        cached = enhanced_vector_store.CachedEmbeddingProvider(CountingProvider(drop_last=True), "test")
+
+        with pytest.raises(RuntimeError, match="returned 1 embeddings for 2 texts"):
+            cached.embed_documents(["a", "bb"])
+